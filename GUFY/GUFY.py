@@ -26,7 +26,7 @@ At the very end, the functions to actually start the application are written.
 """
 import sys
 import os
-from configparser import ConfigParser
+from functools import lru_cache
 import yt
 import PyQt5.QtGui as QG
 import PyQt5.QtCore as QC
@@ -34,10 +34,12 @@ import PyQt5.QtWidgets as QW
 from simgui_modules import dictionaries
 from simgui_modules import utils as sut
 from simgui_modules.plotWindow import PlotWindow
-from simgui_modules.layouts import createAllWidgets
-from simgui_modules.labels import createAllLabels
+from simgui_modules.scriptWriter import WriteToScriptDialog
+from simgui_modules.helpWindows import HelpWindow
+from simgui_modules.layouts import createAllWidgets, HorLayoutStyle
+from simgui_modules.labels import createAllLabels, LabelStyle
 from simgui_modules.buttons import createAllButtons
-from simgui_modules.checkBoxes import createAllCheckBoxes
+from simgui_modules.checkBoxes import createAllCheckBoxes, CheckBoxStyle
 from simgui_modules.signalHandler import fillDataSetDict, SignalHandler, \
     updateLabels
 from simgui_modules.comboBoxes import createAllComboBoxes
@@ -48,19 +50,60 @@ from simgui_modules.logging import createLogger, LoggingOptionsDialog, \
 from simgui_modules.additionalWidgets import createAllStatusInfo, \
     createDataSetSlider, createMenuBar, createTimeSeriesChooser, \
     PlotAllDialog, setUpWidgets, RecalcDialog
-from simgui_modules import derivedFieldWidget as sder
-from simgui_modules import helpWindows as shel
-from simgui_modules.threading import ProgressDialog
-from simgui_modules.scriptWriter import WriteToScriptDialog
-from simgui_modules.configureGUI import ConfigDialog, \
-    getHomeDirectory, loadConfigOptions
-
-
+from simgui_modules.configureGUI import ConfigDialog, getHomeDirectory, \
+    loadConfigOptions, config
 # Import useful exceptions
 from yt.utilities.exceptions import YTOutputNotIdentified
+# yt can't be deferred since most of the simgui_modules import it at module
+# level. Only the derived field dialog and the threading module are imported
+# in the methods that use them.
 __version__ = "1.0.2"
 
 
+@lru_cache(maxsize=16)
+def _cachedLoad(path, signature):
+    """Loads path using yt. The signature is only used as part of the cache
+    key so files that have been changed on disk are loaded again.
+    Parameters:
+        path: file name or series pattern to load
+        signature: hashable that changes whenever the file(s) change
+    returns:
+        ds: yt DataSet or DataSetSeries object
+    """
+    ds = yt.load(path)
+    sut.enlargeChunkCache(ds)
+    return ds
+
+
+def _loadSeries(path, signature):
+    """Loads the series at path and reads the times of its datasets, which
+    means opening each of its files. This is done in the LoadWorker so the
+    GUI stays responsive.
+    returns:
+        series: LazyDataSeries, or a DataSet if path is a single file
+    """
+    return sut.makeLazySeries(_cachedLoad(path, signature))
+
+
+def getFileSignature(filename):
+    """Returns a signature of filename based on its modification time and
+    size."""
+    stat = os.stat(filename)
+    return stat.st_mtime_ns ^ (stat.st_size << 1)
+
+
+def getSeriesSignature(directory, seriesname):
+    """Returns a signature of the series seriesname in directory based on the
+    directory listing."""
+    return hash((seriesname, tuple(sorted(os.listdir(directory)))))
+
+
+def clearDataSetCache():
+    """Clears the cache of loaded datasets and series."""
+    _cachedLoad.cache_clear()
+    GUILogger.info("Cleared the cache of loaded datasets.")
+
+
 # %% Application starts here
 class GUFYMainWindow(QW.QMainWindow):
     """The MainWindow everything is hosted on. All of the widgets are stored
@@ -86,8 +129,9 @@ class GUFYMainWindow(QW.QMainWindow):
         """
         self.setWindowIcon(QG.QIcon('simgui_registry/CoverIcon.png'))
         self.setWindowTitle("GUFY - GUI for FLASH Code simulations based on yt")
-        height = int(QW.QDesktopWidget().screenGeometry(-1).height()*0.85)
-        width = int(QW.QDesktopWidget().screenGeometry(-1).width()*0.7)
+        screenGeometry = QG.QGuiApplication.primaryScreen().availableGeometry()
+        height = int(screenGeometry.height()*0.85)
+        width = int(screenGeometry.width()*0.7)
         self.setGeometry(0, 0, width, height)
         self.move(20, 20)
 
@@ -121,6 +165,7 @@ class GUFYMainWindow(QW.QMainWindow):
         self.Param_Dict = dictionaries.createParam_Dict()
         # here you may toggle testing mode - you will need to set the testfiles
         self.Param_Dict["TestingMode"] = False
+        self.Param_Dict["ClearDSCache"] = clearDataSetCache
 # Buttons:
         self.Button_Dict = dictionaries.createButton_Dict()
 # CheckBoxes:
@@ -216,44 +261,59 @@ class GUFYMainWindow(QW.QMainWindow):
                                                   self.Param_Dict["Directory"],
                                                   "All files (*)")[0]
         if filename != '':
-            try:
-                # SingleDataSet is there so we can go back to a single dataset
-                # if the user loaded one.
-                self.Param_Dict["SingleDataSet"] = self.loadFile(filename)
-                self.Param_Dict["CurrentDataSet"] = self.Param_Dict["SingleDataSet"]
-                self.Param_Dict["Seriesname"] = ""
-                self.Param_Dict["Filename"] = filename
-                self.Status_Dict["Series"].setText(self.Param_Dict["Seriesname"])
-                self.Param_Dict["isValidFile"] = True
-                self.Param_Dict["isValidSeries"] = False
-                self.setUpFile()
-                return
-            except YTOutputNotIdentified:
-                sut.alertUser("Couldn't load this file. Please try again")
-                # Ask the user to enter another series name.
-                # If he cancels, pass.
-                self.testValidFile()
+            self.loadFile(filename)
         else:
             GUILogger.warning("Couldn't load file. Click 'Open File' to start over.")
             return
 
-    def loadFile(self, filename):
-        """Handles loading a given file filename.
+    def loadFile(self, filename, testmode=""):
+        """Handles loading a given file filename. The loading itself is done
+        in a separate thread, receiveFile is called once it has finished.
         Also changes the current working directory
         self.Param_Dict["Directory"].
         Parameters:
             filename: path of the file to load
-        returns:
-            ds: yt DataSet object
+            testmode: geometry of the test file if called through the buttons
+                to test
         """
+        from simgui_modules.threading import startLoading
         # Perform a reverse split to receive the directory and name separately
         directory, name = filename.rsplit('/', 1)
         self.Status_Dict["Dir"].setText(directory)
         self.Status_Dict["File"].setText('File: ' + name)
         self.Param_Dict["Directory"] = directory
-        ds = yt.load(filename)
         GUILogger.info(f"Loading file '{name}'...")
-        return ds
+        self.loadWorker = startLoading(self.Param_Dict, _cachedLoad,
+                                       (filename, getFileSignature(filename)),
+                                       lambda ds: self.receiveFile(ds, filename, testmode),
+                                       self.receiveFileError)
+
+    def receiveFile(self, ds, filename, testmode=""):
+        """Stores the dataset ds loaded from filename and sets up the GUI.
+        testmode is passed on to setUpFile."""
+        # SingleDataSet is there so we can go back to a single dataset
+        # if the user loaded one.
+        self.Param_Dict["SingleDataSet"] = ds
+        self.Param_Dict["CurrentDataSet"] = self.Param_Dict["SingleDataSet"]
+        self.Param_Dict["Seriesname"] = ""
+        self.Param_Dict["Filename"] = filename
+        self.Status_Dict["Series"].setText(self.Param_Dict["Seriesname"])
+        self.Param_Dict["isValidFile"] = True
+        self.Param_Dict["isValidSeries"] = False
+        if testmode:
+            self.Status_Dict["Status"].setText(testmode + " test file loaded.")
+        self.setUpFile(testmode)
+
+    def receiveFileError(self, error):
+        """Handles an error that occured while loading a file"""
+        if not isinstance(error, YTOutputNotIdentified):
+            GUILogger.error(f"Couldn't load this file: {error}")
+            return
+        sut.alertUser("Couldn't load this file. Please try again")
+        # Ask the user to enter another file name.
+        # If he cancels, pass. This is called from the event loop once the
+        # LoadWorker has failed, so retrying doesn't stack up any frames.
+        self.testValidFile()
 
     def setUpFile(self, testmode=""):
         """When the file is given, make it ready for evaluation by updating
@@ -262,27 +322,31 @@ class GUFYMainWindow(QW.QMainWindow):
             testmode: argument given when called through the buttons to test
         """
         if self.Param_Dict["isValidFile"]:
-            self.Param_Dict["SignalHandler"].changeEvalMode()
-            self.Button_Dict["MakeLinePlot"].hide()
-            GUILogger.info("Scanning file for relevant fields...")
-            # Update Geometry and hide the widgets that would cause errors
-            sut.updateGeometry(self.Param_Dict, self.CheckBox_Dict,
-                               self.RadioDict_Dict, self.Edit_Dict,
-                               self.Label_Dict)
-            # Update the comboBoxes according to entries in field lists
-            try:
-                sut.updateFields(self.Param_Dict, self.ComboBox_Dict)
-            except Exception:
-                return
-            sut.resetExtrema(self.Param_Dict, self.Edit_Dict,
-                             self.Button_Dict, self.Label_Dict,
-                             self.ComboBox_Dict, self)
-            self.Param_Dict["SignalHandler"].getOtherUnitInput("Grid")
-            self.Param_Dict["SignalHandler"].setPlotOptions()
-            updateLabels(self.Param_Dict, self.Label_Dict)
-            GUILogger.log(29, f"Loaded '{self.Param_Dict['Filename'].split('/')[-1]}'.")
-            GUILogger.info("It is now ready for plotting.")
-            sut.refreshWidgets(self.Edit_Dict, self.ComboBox_Dict)
+            # Only repaint once after all of the widgets have been updated
+            with sut.pausedUpdates(self):
+                self.Param_Dict["SignalHandler"].changeEvalMode()
+                self.Button_Dict["MakeLinePlot"].hide()
+                GUILogger.info("Scanning file for relevant fields...")
+                # Update Geometry and hide the widgets that would cause errors
+                sut.updateGeometry(self.Param_Dict, self.CheckBox_Dict,
+                                   self.RadioDict_Dict, self.Edit_Dict,
+                                   self.Label_Dict)
+                # Update the comboBoxes according to entries in field lists
+                try:
+                    sut.updateFields(self.Param_Dict, self.ComboBox_Dict)
+                except Exception:
+                    return
+                sut.resetExtrema(self.Param_Dict, self.Edit_Dict,
+                                 self.Button_Dict, self.Label_Dict,
+                                 self.ComboBox_Dict, self)
+                # Extrema calculated during earlier sessions need no rescan
+                sut.restoreCachedExtrema(self.Param_Dict)
+                self.Param_Dict["SignalHandler"].getOtherUnitInput("Grid")
+                self.Param_Dict["SignalHandler"].setPlotOptions()
+                updateLabels(self.Param_Dict, self.Label_Dict)
+                GUILogger.log(29, f"Loaded '{self.Param_Dict['Filename'].split('/')[-1]}'.")
+                GUILogger.info("It is now ready for plotting.")
+                sut.refreshWidgets(self.Edit_Dict, self.ComboBox_Dict)
 
     # %% Methods for series opening and loading
     def testValidSeries(self):
@@ -293,61 +357,71 @@ class GUFYMainWindow(QW.QMainWindow):
         directory = QW.QFileDialog.getExistingDirectory(self, "Select a directory with your series in it",
                                                         self.Param_Dict["Directory"])
         if directory != '':
-            # Information on DataSetSeries object:
-            # http://yt-project.org/doc/reference/api/yt.data_objects.time_series.html#yt.data_objects.time_series.DataSetSeries
-            ts = self.loadSeries(directory)
-            if ts is None:
-                return
-            try:
-                GUILogger.info(f"This series includes {len(ts)} files.")
-#                ts = [yt.load(filename) for filename in ts._pre_outputs]
-                self.Param_Dict["DataSeries"] = ts
-                self.setUpSeries()
-            except TypeError:
-                self.RadioDict_Dict["EvalMode"]["Single file"].setChecked(True)
-                self.Param_Dict["SingleDataSet"] = ts
-                GUILogger.warning("Only a single file has been selected. Changing to single file mode.")
-                self.Param_Dict["Filename"] = self.Param_Dict["Seriesname"]
-                self.Param_Dict["Seriesname"] = ""
-                self.Status_Dict["Series"].setText(self.Param_Dict["Seriesname"])
-                self.Status_Dict["File"].setText(self.Param_Dict["Seriesname"])
-                self.Param_Dict["isValidFile"] = True
-                self.Param_Dict["isValidSeries"] = False
-                self.setUpFile()
+            self.loadSeries(directory)
 
     def loadSeries(self, directory):
-        """Handles loading a given series in a directory.
+        """Handles loading a given series in a directory. The loading itself,
+        including reading the times of the files, is done in a separate
+        thread, receiveSeries is called once it has finished.
         Also changes the current working directory
         self.Param_Dict["Directory"]
         Parameters:
             directory: path of the series
-        returns:
-            ts: yt DataSetSeries object
         """
+        from simgui_modules.threading import startLoading
         GUILogger.info(f"{directory} is directory for series mode")
         self.Status_Dict["Dir"].setText(directory)
         self.Param_Dict["Directory"] = directory
         ok = self.askSeriesName()
         if ok:
-            try:
-                GUILogger.info(f"Loading series '{self.Param_Dict['Seriesname']}'...")
-                ts = yt.load(directory + '/' + self.Param_Dict["Seriesname"])
-                self.Param_Dict["Filename"] = ""
-                self.Status_Dict["File"].setText(self.Param_Dict["Filename"])
-                self.Param_Dict["isValidSeries"] = True
-                self.Param_Dict["isValidFile"] = True
-                return ts
-            except YTOutputNotIdentified:
-                sut.alertUser("Couldn't load this series. Please try again")
-                # Ask the user to enter another series name.
-                # If he cancels, pass.
-                return self.loadSeries(directory)
+            GUILogger.info(f"Loading series '{self.Param_Dict['Seriesname']}'...")
+            seriesname = self.Param_Dict["Seriesname"]
+            self.loadWorker = startLoading(self.Param_Dict, _loadSeries,
+                                           (directory + '/' + seriesname,
+                                            getSeriesSignature(directory, seriesname)),
+                                           self.receiveSeries,
+                                           lambda error: self.receiveSeriesError(error, directory))
         else:
             GUILogger.warning("Couldn't load series.")
             GUILogger.log(29, "Try replacing the last digits of your series with "
                           "questionmarks or import all files of the directory "
                           "by using *")
-            return None
+
+    def receiveSeries(self, ts):
+        """Stores the series ts and sets up the GUI. If only a single file has
+        been loaded, switch to single file mode."""
+        self.Param_Dict["Filename"] = ""
+        self.Status_Dict["File"].setText(self.Param_Dict["Filename"])
+        self.Param_Dict["isValidSeries"] = True
+        self.Param_Dict["isValidFile"] = True
+        # Information on DataSetSeries object:
+        # http://yt-project.org/doc/reference/api/yt.data_objects.time_series.html#yt.data_objects.time_series.DataSetSeries
+        try:
+            GUILogger.info(f"This series includes {len(ts)} files.")
+            self.Param_Dict["DataSeries"] = ts
+            self.setUpSeries()
+        except TypeError:
+            self.RadioDict_Dict["EvalMode"]["Single file"].setChecked(True)
+            self.Param_Dict["SingleDataSet"] = ts
+            GUILogger.warning("Only a single file has been selected. Changing to single file mode.")
+            self.Param_Dict["Filename"] = self.Param_Dict["Seriesname"]
+            self.Param_Dict["Seriesname"] = ""
+            self.Status_Dict["Series"].setText(self.Param_Dict["Seriesname"])
+            self.Status_Dict["File"].setText(self.Param_Dict["Seriesname"])
+            self.Param_Dict["isValidFile"] = True
+            self.Param_Dict["isValidSeries"] = False
+            self.setUpFile()
+
+    def receiveSeriesError(self, error, directory):
+        """Handles an error that occured while loading a series in
+        directory"""
+        if not isinstance(error, YTOutputNotIdentified):
+            GUILogger.error(f"Couldn't load this series: {error}")
+            return
+        sut.alertUser("Couldn't load this series. Please try again")
+        # Ask the user to enter another series name.
+        # If he cancels, pass. As for files, this doesn't recurse.
+        self.loadSeries(directory)
 
     def askSeriesName(self):
         """Promts the user to enter a seriesname and saves it to
@@ -356,12 +430,12 @@ class GUFYMainWindow(QW.QMainWindow):
         returns:
             ok: True if user enters ok, False if user cancels
         """
-        possibleNames = []
         # create a completer with the strings in the column as model
         directory = self.Param_Dict["Directory"]
-        for file in os.listdir(directory):
-            if os.path.isfile(f"{directory}/{file}") and not file.endswith(".py"):
-                possibleNames.append(file)
+        # scandir provides the file type without an extra stat call per file
+        with os.scandir(directory) as entries:
+            possibleNames = [entry.name for entry in entries
+                             if entry.is_file() and not entry.name.endswith(".py")]
         possibleNames.append("*")
         seriesname, ok = QW.QInputDialog.getItem(self, "Name of the series",
                                                  f"Directory:\n{directory}\n\n"
@@ -382,31 +456,33 @@ class GUFYMainWindow(QW.QMainWindow):
         """When the series is given, make it ready for evaluation by updating
         fields for the axes"""
         if self.Param_Dict["isValidSeries"]:
-            self.Param_Dict["SignalHandler"].changeEvalMode()
-            self.Status_Dict["Status"].setText("Series ready to evaluate.")
-            self.Button_Dict["MakeLinePlot"].hide()
-            GUILogger.info("Scanning the first file for relevant fields...")
-            # Update Geometry and hide the widgets that would cause errors
-            self.Param_Dict["CurrentDataSet"] = self.Param_Dict["DataSeries"][0]
-            sut.updateGeometry(self.Param_Dict, self.CheckBox_Dict,
-                               self.RadioDict_Dict, self.Edit_Dict,
-                               self.Label_Dict)
-            # Update the comboBoxes according to entries in field lists
-            try:
-                sut.updateFields(self.Param_Dict, self.ComboBox_Dict)
-            except Exception:
-                return
-            sut.resetExtrema(self.Param_Dict, self.Edit_Dict,
-                             self.Button_Dict, self.Label_Dict,
-                             self.ComboBox_Dict, self)
-            self.Param_Dict["SignalHandler"].getOtherUnitInput("Grid")
-            fillDataSetDict(self.Param_Dict, self.Status_Dict,
-                            self.Wid_Dict["TopLayout"], self._main)
-            setUpWidgets(self.Param_Dict, self.CheckBox_Dict,
-                         self.Misc_Dict)
-            updateLabels(self.Param_Dict, self.Label_Dict)
-            self.Param_Dict["SignalHandler"].setPlotOptions()
-            sut.refreshWidgets(self.Edit_Dict, self.ComboBox_Dict)
+            # Only repaint once after all of the widgets have been updated
+            with sut.pausedUpdates(self):
+                self.Param_Dict["SignalHandler"].changeEvalMode()
+                self.Status_Dict["Status"].setText("Series ready to evaluate.")
+                self.Button_Dict["MakeLinePlot"].hide()
+                GUILogger.info("Scanning the first file for relevant fields...")
+                # Update Geometry and hide the widgets that would cause errors
+                self.Param_Dict["CurrentDataSet"] = self.Param_Dict["DataSeries"][0]
+                sut.updateGeometry(self.Param_Dict, self.CheckBox_Dict,
+                                   self.RadioDict_Dict, self.Edit_Dict,
+                                   self.Label_Dict)
+                # Update the comboBoxes according to entries in field lists
+                try:
+                    sut.updateFields(self.Param_Dict, self.ComboBox_Dict)
+                except Exception:
+                    return
+                sut.resetExtrema(self.Param_Dict, self.Edit_Dict,
+                                 self.Button_Dict, self.Label_Dict,
+                                 self.ComboBox_Dict, self)
+                self.Param_Dict["SignalHandler"].getOtherUnitInput("Grid")
+                fillDataSetDict(self.Param_Dict, self.Status_Dict,
+                                self.Wid_Dict["TopLayout"], self._main)
+                setUpWidgets(self.Param_Dict, self.CheckBox_Dict,
+                             self.Misc_Dict)
+                updateLabels(self.Param_Dict, self.Label_Dict)
+                self.Param_Dict["SignalHandler"].setPlotOptions()
+                sut.refreshWidgets(self.Edit_Dict, self.ComboBox_Dict)
 
     # %%Methods for file and series evaluation:
     def evaluateSingle(self):
@@ -420,6 +496,7 @@ class GUFYMainWindow(QW.QMainWindow):
             return
         GUILogger.info("Evaluation started. Checking for missing extrema...")
         sut.checkExtremaForPlot(self.Param_Dict)
+        from simgui_modules.threading import ProgressDialog
         self.progressDialog = ProgressDialog(self.Param_Dict, self, mode="PlotSingle")
         self.progressWorker.finished.connect(self.giveSingleFeedback)
 
@@ -430,10 +507,7 @@ class GUFYMainWindow(QW.QMainWindow):
         mode = self.Param_Dict["PlotMode"]
         if success:
             GUILogger.log(29, f"{mode} plot successful.")
-            cart = self.Param_Dict["Geometry"] == "cartesian"
-            aligned = self.Param_Dict["NormVecMode"] == "Axis-Aligned"
-            slcproj = mode in ["Slice", "Projection"]
-            if cart and slcproj and aligned:
+            if self.canDrawLine():
                 self.Button_Dict["MakeLinePlot"].show()
 
     def evaluateMultiple(self, Request_Dict):
@@ -445,6 +519,7 @@ class GUFYMainWindow(QW.QMainWindow):
                 return
         GUILogger.info("Evaluation started. Checking for missing extrema...")
         sut.checkExtremaForPlot(self.Param_Dict)
+        from simgui_modules.threading import ProgressDialog
         self.progressDialog = ProgressDialog(self.Param_Dict, self,
                                              mode="PlotAll",
                                              Request_Dict=Request_Dict,
@@ -458,14 +533,20 @@ class GUFYMainWindow(QW.QMainWindow):
             GUILogger.log(29, f"{mode} plots successful.")
             if directory != "":
                 GUILogger.log(29, f"The pictures have been saved to <b>{directory}</b>.")
-            cart = self.Param_Dict["Geometry"] == "cartesian"
-            aligned = self.Param_Dict["NormVecMode"] == "Axis-Aligned"
-            slcproj = mode in ["Slice", "Projection"]
-            if cart and slcproj and aligned:
+            if self.canDrawLine():
                 self.Button_Dict["MakeLinePlot"].show()
 
+    def canDrawLine(self):
+        """Returns whether a line for a line plot can be drawn on the current
+        plot, which is only possible for axis-aligned slice and projection
+        plots in cartesian geometry."""
+        return (self.Param_Dict["Geometry"] == "cartesian" and
+                self.Param_Dict["NormVecMode"] == "Axis-Aligned" and
+                self.Param_Dict["PlotMode"] in ("Slice", "Projection"))
+
     # %% Methods for dialog opening (derived fields, script writing etc.):
     def openDerFieldDialog(self):
+        from simgui_modules import derivedFieldWidget as sder
         self.fDialog = sder.AskFieldDialog(self.Param_Dict["ZFields"],
                                            self.Param_Dict["CurrentDataSet"],
                                            self)
@@ -498,6 +579,7 @@ class GUFYMainWindow(QW.QMainWindow):
 
     def testWindow(self):
         """Outdated method for testing"""
+        from simgui_modules.threading import ProgressDialog
         self.testWindow = ProgressDialog(self.Param_Dict, self, mode="Test")
         self.testWindow.finished.connect(self.giveFeedback)
 
@@ -517,6 +599,8 @@ class GUFYMainWindow(QW.QMainWindow):
             toolbar._idRelease = toolbar.canvas.mpl_disconnect(toolbar._idRelease)
         toolbar.mode = ''
         self.Edit_Dict["LineUnit"].setText(self.Param_Dict["oldGridUnit"])
+        # Remember the main axes for the fast check in lScreenInput
+        self.lineAxes = self.Param_Dict["CurrentPlotWindow"].ax
         self.Starter = self.Param_Dict["CurrentPlotWindow"].canvas.mpl_connect('button_press_event', self.lStartInput)
         self.Ender = self.Param_Dict["CurrentPlotWindow"].canvas.mpl_connect('button_release_event', self.lEndInput)
 
@@ -529,7 +613,7 @@ class GUFYMainWindow(QW.QMainWindow):
     def lScreenInput(self, event):
         """Updates the line on screen in real time"""
         # This line checks wheather the mouse is still over the relevant Axes
-        if str(event.inaxes)[:11] == "AxesSubplot":
+        if event.inaxes is self.lineAxes:
             xminmax = [self.Param_Dict["XLStart"], event.xdata]
             yminmax = [self.Param_Dict["YLStart"], event.ydata]
             self.Param_Dict["CurrentPlotWindow"].drawLine(xminmax, yminmax)
@@ -540,13 +624,24 @@ class GUFYMainWindow(QW.QMainWindow):
         self.Param_Dict["CurrentPlotWindow"].canvas.mpl_disconnect(self.cid)
         sut.shuffleCoords(self.Param_Dict)
         sut.changeToLinePlot(self.Param_Dict, self.Edit_Dict)
-        self.RadioDict_Dict["1DOptions"]["Line"].setChecked(True)
-        self.RadioDict_Dict["DimMode"]["1D"].setChecked(True)
-        self.ComboBox_Dict["YAxis"].setCurrentText(self.Param_Dict["ZAxis"])
-        self.Edit_Dict["YUnit"].setText(self.Param_Dict["ZUnit"])
-        self.Edit_Dict["YMin"].setText(f"{self.Param_Dict['ZMin']:.3g}")
-        self.Edit_Dict["YMax"].setText(f"{self.Param_Dict['ZMax']:.3g}")
-        self.CheckBox_Dict["YLog"].setChecked(self.Param_Dict["ZLog"])
+        with sut.pausedUpdates(self):
+            self.RadioDict_Dict["1DOptions"]["Line"].setChecked(True)
+            self.RadioDict_Dict["DimMode"]["1D"].setChecked(True)
+            self.ComboBox_Dict["YAxis"].setCurrentText(self.Param_Dict["ZAxis"])
+            # Set the texts without triggering the slots for every single
+            # edit, since setting the unit would convert the old extrema first
+            texts = {"YUnit": self.Param_Dict["ZUnit"],
+                     "YMin": f"{self.Param_Dict['ZMin']:.3g}",
+                     "YMax": f"{self.Param_Dict['ZMax']:.3g}"}
+            for key, text in texts.items():
+                self.Edit_Dict[key].blockSignals(True)
+                self.Edit_Dict[key].setText(text)
+                self.Edit_Dict[key].blockSignals(False)
+            hand = self.Param_Dict["SignalHandler"]
+            hand.getUnitInput("Y", fieldChange=True)
+            hand.getExtremaInput("Y", "Min")
+            hand.getExtremaInput("Y", "Max")
+            self.CheckBox_Dict["YLog"].setChecked(self.Param_Dict["ZLog"])
         self.Param_Dict["YLog"] = self.Param_Dict["ZLog"]
         self.Param_Dict["CurrentPlotWindow"].canvas.mpl_disconnect(self.Ender)
         GUILogger.log(29, "Line inputs have been updated. Press 'Create Plot' to make the line plot.")
@@ -557,8 +652,8 @@ class GUFYMainWindow(QW.QMainWindow):
     def closeEvent(self, event):
         """To be sure that all HelpWindows are closed and PlotWindows can't
         restore the settings anymore"""
-        config = ConfigParser()
-        config.read("simgui_registry/GUIconfig.ini")
+        # The config is parsed once on import and kept up to date by the
+        # ConfigDialog, so there's no need to read the file again
         if config.getboolean("CheckBoxes", "quitdialog"):
             reply = QW.QMessageBox.question(self, "Quit GUFY?",
                                             "Do you really want to quit?\n\n"
@@ -570,13 +665,11 @@ class GUFYMainWindow(QW.QMainWindow):
                 event.ignore()
                 return
         app = QW.QApplication.instance()
+        dialogClasses = (LoggingOptionsDialog, HelpWindow, ConfigDialog)
         for widget in app.topLevelWidgets():
-            cond1 = isinstance(widget, LoggingOptionsDialog)
-            cond2 = isinstance(widget, shel.HelpWindow)
-            cond3 = isinstance(widget, ConfigDialog)
-            if any([cond1, cond2, cond3]):
+            if isinstance(widget, dialogClasses):
                 widget.close()
-            if isinstance(widget, PlotWindow):
+            elif isinstance(widget, PlotWindow):
                 widget.setParent(None)  # This is important
                 widget.restoreSettings.setDisabled(True)
         super().closeEvent(event)
@@ -590,14 +683,8 @@ class GUFYMainWindow(QW.QMainWindow):
             filename = "C:/Users/Fabian Balzer/Documents/Studium/Bachelor/DataSeries/FIS_1_M=2_10_MJ_hdf5_chk_0037"
         else:
             filename = "C:/Users/Fabian Balzer/Documents/Studium/Bachelor/DataSeries/SI_2D_hdf5_chk_0000"
-        self.Param_Dict["SingleDataSet"] = self.loadFile(filename)
-        self.Param_Dict["CurrentDataSet"] = self.Param_Dict["SingleDataSet"]
-        self.Param_Dict["Seriesname"] = ""
-        self.Status_Dict["Series"].setText(self.Param_Dict["Seriesname"])
-        self.Param_Dict["Filename"] = filename
-        self.Param_Dict["isValidFile"], self.Param_Dict["isValidSeries"] = True, False
-        self.Status_Dict["Status"].setText(geometry + " test file loaded.")
-        self.setUpFile(geometry)
+        self.Status_Dict["Status"].setText(f"Loading {geometry.lower()} test file...")
+        self.loadFile(filename, testmode=geometry)
 
     def loadTestSeries(self):
         """For a quick way to test, load a given series."""
@@ -607,12 +694,21 @@ class GUFYMainWindow(QW.QMainWindow):
         self.Param_Dict["Seriesname"] = "SI_2D_hdf5_chk_000?"
         self.Status_Dict["Series"].setText('Series:' + self.Param_Dict["Seriesname"])
         self.Status_Dict["Status"].setText("Loading series '{}'...".format(self.Param_Dict["Seriesname"]))
-        self.Status_Dict["Status"].repaint()
-        ts = yt.load(seriesname)
-        dsList = [yt.load(filename) for filename in ts._pre_outputs]
+        from simgui_modules.threading import startLoading
+
+        def loadList(seriesname):
+            # Only the times are read, the datasets are opened once needed
+            return sut.makeLazySeries(yt.load(seriesname))
+        self.loadWorker = startLoading(self.Param_Dict, loadList,
+                                       (seriesname,),
+                                       lambda dsList: self.receiveTestSeries(dsList, seriesname),
+                                       lambda error: GUILogger.error(f"Couldn't load test series: {error}"))
+
+    def receiveTestSeries(self, dsList, seriesname):
+        """Stores the test series dsList and sets up the GUI"""
         self.Param_Dict["DataSeries"] = dsList
         self.Param_Dict["Filename"] = ""
-        self.Param_Dict["Directory"] = seriesname.strip("/SI_2D_hdf5_chk_000?")
+        self.Param_Dict["Directory"] = os.path.dirname(seriesname)
         self.Status_Dict["File"].setText(self.Param_Dict["Filename"])
         self.Param_Dict["isValidFile"], self.Param_Dict["isValidSeries"] = True, True
         self.Status_Dict["Status"].setText("Test time series loaded.")
@@ -627,6 +723,9 @@ def startProgram():
     qapp = QW.QApplication.instance()
     if not qapp:
         qapp = QW.QApplication(sys.argv)
+    # The style sheets shared by many widgets are only parsed once this way
+    for styleSheet in [CheckBoxStyle, LabelStyle, HorLayoutStyle]:
+        sut.addAppStyleSheet(qapp, styleSheet)
     app = GUFYMainWindow()  # creating the instance
     app.show()
     qapp.exec_()  # Start the Qt event loop
@@ -25,11 +25,12 @@ This module is structured as follows:
 
 import PyQt5.QtWidgets as QW
 import PyQt5.QtCore as QC
-import PyQt5.QtGui as QG
+from functools import partial
 from math import ceil
 from simgui_modules.checkBoxes import coolCheckBox
-from simgui_modules.helpWindows import HelpWindow
+from simgui_modules.helpWindows import showHelpWindow, PlotHelpKeys
 from simgui_modules.logging import StatusHandler, GUILogger
+from simgui_modules.utils import getIcon
 
 
 # %% Functions for creating the Status Bar
@@ -72,8 +73,10 @@ def createStatusLabels(Param_Dict):
         statusList: List containing [status, directory, file, seriesname]
     """
     status = QW.QLabel("Click 'Open file' to start.")
+    # Qt repaints it when idle. Files and series (including the times of all
+    # files of a series) are read in a LoadWorker, so the event loop keeps
+    # running while the progress is logged.
     StatusHandler.newText.connect(status.setText)
-    StatusHandler.newText.connect(status.repaint)
     status.setFixedWidth(500)
     directory = QW.QLabel(Param_Dict["Directory"])
     directory.setMaximumWidth(500)
@@ -84,6 +87,45 @@ def createStatusLabels(Param_Dict):
 
 
 # %% Functions for creating and setting up the Slider for time series
+# Pool for loading the datasets next to the selected one in the background.
+# yt isn't thread-safe when the same dataset or data object is used by more
+# than one thread, which is why the field functions are only called on the
+# sample data in the main thread. Loading a file nobody else uses only creates
+# a new dataset, which this thread doesn't touch afterwards. It is handed over
+# through the locked cache of the series. A single thread is enough for the
+# two neighbours and keeps the loads out of each other's way.
+PrefetchPool = QC.QThreadPool()
+PrefetchPool.setMaxThreadCount(1)
+
+
+class PrefetchWorker(QC.QRunnable):
+    """Loads the dataset at index of the series so it is already available
+    once the user moves the slider there. The dataset isn't used in this
+    thread besides loading it."""
+    def __init__(self, series, index):
+        super().__init__()
+        self.series = series
+        self.index = index
+
+    def run(self):
+        try:
+            self.series[self.index]
+        except Exception as e:
+            GUILogger.debug(f"Couldn't prefetch dataset {self.index}: {e}")
+
+
+def prefetchNeighbours(Param_Dict, slider):
+    """Starts loading the datasets before and after the one selected by
+    slider in the background."""
+    series = Param_Dict["DataSeries"]
+    if not Param_Dict["isValidSeries"] or not hasattr(series, "isLoaded"):
+        return
+    value = slider.value()
+    for index in (value + 1, value - 1):
+        if 0 <= index < len(series) and not series.isLoaded(index):
+            PrefetchPool.start(PrefetchWorker(series, index))
+
+
 def createDataSetSlider(Param_Dict, Misc_Dict):
     """Creates a QSlider object to select the file to show for the current
     plot"""
@@ -95,6 +137,12 @@ def createDataSetSlider(Param_Dict, Misc_Dict):
     slider.setToolTip("Select the desired data set of the time series.")
     slider.hide()  # It will be shown when the user selects time series mode
     slider.valueChanged.connect(lambda: Param_Dict["SignalHandler"].getSliderInput())
+    # Wait until the user stops dragging before prefetching the neighbours
+    slider.prefetchTimer = QC.QTimer(slider)
+    slider.prefetchTimer.setSingleShot(True)
+    slider.prefetchTimer.setInterval(50)
+    slider.prefetchTimer.timeout.connect(lambda: prefetchNeighbours(Param_Dict, slider))
+    slider.valueChanged.connect(lambda: slider.prefetchTimer.start())
     Misc_Dict["SeriesSlider"] = slider
 
 
@@ -103,7 +151,7 @@ def setUpWidgets(Param_Dict, CheckBox_Dict, Misc_Dict):
     slider = Misc_Dict["SeriesSlider"]
     length = len(Param_Dict["DataSeries"])
     slider.setRange(0, length-1)
-    GUILogger.log(29, f"Loaded all {length} datasets of '{str(Param_Dict['Seriesname'])}'.")
+    GUILogger.log(29, f"Read the times of all {length} datasets of '{str(Param_Dict['Seriesname'])}'.")
     GUILogger.info("They are now ready for plotting.")
     slider.valueChanged.emit(0)
     slider.show()
@@ -114,6 +162,16 @@ def setUpWidgets(Param_Dict, CheckBox_Dict, Misc_Dict):
 
 
 # %% The coolSpinBox class and functions for SpinBoxes
+def makeOrdinal(n):
+    """Returns the ordinal string of n as used by the coolSpinBox, where 1 is
+    left out, i. e. "", "2nd ", "3rd ", "4th ", ..., "11th ", "21st "."""
+    if n == 1:
+        return ""
+    if n % 100 in (11, 12, 13):
+        return f"{n}th "
+    return f"{n}{ {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')} "
+
+
 class coolSpinBox(QW.QSpinBox):
     """Modified version of QSpinBox
     Creates a QSpinBox with a given range and start value
@@ -122,6 +180,9 @@ class coolSpinBox(QW.QSpinBox):
         value: start value. Needs to be in range.
         tooltip: optionally create a tooltip for the edit
     """
+    # The texts are precomputed for the values a spinner usually reaches
+    Ordinals = tuple(makeOrdinal(n) for n in range(1024))
+
     def __init__(self, range_=(0, 100), value=50, tooltip=None, width=250):
         super().__init__()
         self.setRange(*range_)
@@ -135,12 +196,9 @@ class coolSpinBox(QW.QSpinBox):
 
     def textFromValue(self, value):
         """Turn the input value into a fitting string."""
-        if value == 1:
-            value = ""
-        else:
-            suf = lambda n: "%d%s "%(n,{1:"st",2:"nd",3:"rd"}.get(n if n<20 else n%10,"th"))
-            value = suf(value)
-        return value
+        if 0 <= value < len(self.Ordinals):
+            return self.Ordinals[value]
+        return makeOrdinal(value)
 
 
 def createBufferSpinner(width=100):
@@ -203,7 +261,7 @@ class PlotAllDialog(QW.QDialog):
         self.initUi()
         self.signalsConnection()
         self.resize(400, 300)
-        self.setWindowIcon(QG.QIcon('simgui_registry/CoverIcon.png'))
+        self.setWindowIcon(getIcon('simgui_registry/CoverIcon.png'))
         self.setWindowTitle("Options for plotting every file")
         self.show()
 
@@ -211,22 +269,27 @@ class PlotAllDialog(QW.QDialog):
         """Initialize all of the ingredients for this UI."""
         # Buttons for closing the window:
         self.buttonBox = QW.QDialogButtonBox(self)
-        self.buttonBox.addButton("Create {} plots".format(self.plotNumber), QW.QDialogButtonBox.AcceptRole)
+        self.createButton = self.buttonBox.addButton("Create {} plots".format(self.plotNumber), QW.QDialogButtonBox.AcceptRole)
         self.buttonBox.addButton("Cancel", QW.QDialogButtonBox.RejectRole)
         self.textBrowser = QW.QTextBrowser()
         text = """<p>Producing a plot for each dataset of the series may,
         depending on your computer specifications and the complexity of the
         plots, take a very long time.</p>
-        <p>If you still want to proceed, press the <b>"Create {} plots"</b>-Button
+        <p>If you still want to proceed, press the <b>"Create plots"</b>-Button
         below. I recommend doing a test plot on just one file before that.</p>
         <p>If you want, you can change how many files are considered and
         whether pictures of the plot are saved so you can make a movie out of
-        them.</p>""".format(self.plotNumber)
+        them.</p>"""
         self.textBrowser.setHtml(text)
+        # The number of plots is kept out of the html so the text browser
+        # doesn't need to be reparsed whenever it changes
+        self.plotCountLabel = QW.QLabel()
+        self.setPlotCountText()
         self.onlyEverySpinner = createOnlyEverySpinner(self.plotNumber)
         self.movieCheckBox = coolCheckBox(text="Save plots as frames for a movie", width=None)
         layout = QW.QVBoxLayout()
         layout.addWidget(self.textBrowser)
+        layout.addWidget(self.plotCountLabel)
         layout.addWidget(self.onlyEverySpinner)
         layout.addWidget(self.movieCheckBox)
         layout.addWidget(self.buttonBox)
@@ -258,14 +321,15 @@ class PlotAllDialog(QW.QDialog):
     def getOnlyEveryInput(self, value):
         """Read out the current value of the spin box and format corresponding
         texts."""
-        oldNumber = self.plotNumber
         self.plotNumber = ceil(self.length/value)
-        browseText = self.textBrowser.toHtml()
-        newText = browseText.replace("Create {} plots".format(oldNumber),
-                                     "Create {} plots".format(self.plotNumber))
-        self.textBrowser.setHtml(newText)
         self.onlyEvery = value
-        self.buttonBox.buttons()[0].setText("Create {} plots".format(self.plotNumber))
+        self.setPlotCountText()
+        self.createButton.setText("Create {} plots".format(self.plotNumber))
+
+    def setPlotCountText(self):
+        """Show how many plots are going to be created."""
+        self.plotCountLabel.setText(f"Files of the series: {self.length}, "
+                                    f"plots to create: {self.plotNumber}")
 
 
 # %% The RecalcDialog class for recalculating extrema in time series mode
@@ -291,7 +355,7 @@ class RecalcDialog(QW.QDialog):
         self.initUi()
         self.signalsConnection()
         self.resize(200, 100)
-        self.setWindowIcon(QG.QIcon('simgui_registry/CoverIcon.png'))
+        self.setWindowIcon(getIcon('simgui_registry/CoverIcon.png'))
         self.setWindowTitle("Options for extrema calculation")
         self.show()
 
@@ -299,10 +363,11 @@ class RecalcDialog(QW.QDialog):
         """Initialize all of the ingredients for this UI."""
         # Buttons for closing the window:
         self.buttonBox = QW.QDialogButtonBox(self)
-        self.buttonBox.addButton(f"Get extrema of the file selected",
-                                 QW.QDialogButtonBox.AcceptRole)
-        self.buttonBox.addButton(f"Get global extrema ({self.length} files)",
-                                 QW.QDialogButtonBox.AcceptRole)
+        self.localButton = self.buttonBox.addButton(
+            f"Get extrema of the file selected", QW.QDialogButtonBox.AcceptRole)
+        self.globalButton = self.buttonBox.addButton(
+            f"Get global extrema ({self.length} files)",
+            QW.QDialogButtonBox.AcceptRole)
         self.buttonBox.addButton("Cancel", QW.QDialogButtonBox.RejectRole)
         self.textBrowser = QW.QTextBrowser()
         text = """<p>You may calculate the extrema for the whole series if you
@@ -321,8 +386,8 @@ class RecalcDialog(QW.QDialog):
         """Connects all the signals and emits some of them for a proper start
         """
         hand = self.Param_Dict["SignalHandler"]
-        self.buttonBox.buttons()[0].clicked.connect(lambda: hand.calculateExtrema(self.axis))
-        self.buttonBox.buttons()[1].clicked.connect(lambda: hand.calculateExtrema(self.axis, series=True))
+        self.localButton.clicked.connect(lambda: hand.calculateExtrema(self.axis))
+        self.globalButton.clicked.connect(lambda: hand.calculateExtrema(self.axis, series=True))
         self.buttonBox.accepted.connect(self.accept)
         self.buttonBox.rejected.connect(self.cancelPressed)
 
@@ -352,31 +417,64 @@ class coolAction(QW.QAction):
         if slot is not None:
             self.triggered.connect(slot)
         if helpKey is not None:
-            self.triggered.connect(lambda: self.openHelpWindow(helpKey))
+            self.triggered.connect(partial(self.openHelpWindow, helpKey))
 
-    def openHelpWindow(self, key):
-        """Opens a help window if that's what the action is for"""
-        self.helpWindow = HelpWindow(key, parent=self.parent())
-        self.helpWindow.show()
+    def openHelpWindow(self, key, checked=False):
+        """Opens a help window if that's what the action is for.
+        checked is passed by the triggered signal and ignored."""
+        self.helpWindow = showHelpWindow(key, parent=self.parent())
+
+
+# Style sheet of the menu bar
+MenuBarStyle = """
+QMenuBar {
+background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f6f7fa,
+stop: 1 #dadbde); border-style: outset; border-width: 1px; border-radius: 0px;
+border-color: gray
+}
+QMenuBar::item {
+    spacing: 3px; /* spacing between menu bar items */
+    padding: 1px 4px;
+    background: transparent;
+    border-radius: 2px;
+}
+QMenuBar::item:selected { /* when selected using mouse or keyboard */
+    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop:
+        0 rgb(240, 240, 255), stop: 1 rgb(200, 200, 200))
+}
+QMenuBar::item:pressed {
+    background-color:
+    qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop:
+    0 rgb(200, 200, 200), stop: 1 rgb(140, 140, 140))
+}
+"""
 
 
 def createMenuBar(Window):
     """Creates a menubar on the window Window with all of the needed actions"""
     Action_Dict = {}
 
-    def changeEvalMode(key):
+    # The slots are bound with partial, so they also receive the checked
+    # argument of the triggered signal
+    def changeEvalMode(key, checked=False):
         Window.RadioDict_Dict["EvalMode"][key].setChecked(True)
         Window.openFile()
     Action_Dict["OpenFile"] = coolAction("Open file", "Ctrl+O", "Open a new "
-                                         "file", lambda: changeEvalMode("Single file"),
+                                         "file", partial(changeEvalMode, "Single file"),
                                          parent=Window)
     Action_Dict["OpenDir"] = coolAction("Open directory", "Ctrl+D", "Open a ne"
                                         "w directory",
-                                        lambda: changeEvalMode("Time series"),
+                                        partial(changeEvalMode, "Time series"),
                                         parent=Window)
     Action_Dict["CreatePlot"] = coolAction("Create Plot", "Ctrl+Return", "Start"
                                            " evaluation with the current settings",
                                            Window.evaluateSingle, parent=Window)
+    Action_Dict["ClearDSCache"] = coolAction("Clear dataset cache", statusTip=
+                                             "Forget the datasets loaded so "
+                                             "far so they are read from disk "
+                                             "again",
+                                             slot=Window.Param_Dict["ClearDSCache"],
+                                             parent=Window)
     Action_Dict["Exit"] = coolAction("Exit", "Ctrl+Q", "Leave the app",
                                      lambda: Window.close(),
                                      parent=Window)
@@ -388,11 +486,9 @@ def createMenuBar(Window):
                                            "Open options for logging",
                                            Window.openLoggingOptionsDialog,
                                            parent=Window)
-    helpKeys = ["derived fields", "line plots", "slice plots", "phase plots",
-                "profile plots", "projection plots"]
     modeKeys = ["Profile", "Line", "Phase", "Slice", "Projection"]
 
-    def changePlotMode(mode):
+    def changePlotMode(mode, checked=False):
         """Quickly switch to desired plot mode"""
         if mode in ["Line", "Profile"]:
             Window.RadioDict_Dict["DimMode"]["1D"].setChecked(True)
@@ -400,58 +496,25 @@ def createMenuBar(Window):
         else:
             Window.RadioDict_Dict["DimMode"]["2D"].setChecked(True)
             Window.RadioDict_Dict["2DOptions"][mode].setChecked(True)
-    # Unfortunately a for loop over modeKeys didn't work...
-    Action_Dict["Profile"] = coolAction("Profile", "Ctrl+1", "Open profile "
-                                        "plot mode",
-                                        lambda: changePlotMode("Profile"),
-                                        parent=Window)
-    Action_Dict["Line"] = coolAction("Line", "Ctrl+2", "Open line plot mode",
-                                     lambda: changePlotMode("Line"),
-                                     parent=Window)
-    Action_Dict["Phase"] = coolAction("Phase", "Ctrl+3", "Open phase plot mode",
-                                      lambda: changePlotMode("Phase"),
-                                      parent=Window)
-    Action_Dict["Slice"] = coolAction("Slice", "Ctrl+4", "Open slice plot mode",
-                                      lambda: changePlotMode("Slice"),
-                                      parent=Window)
-    Action_Dict["Projection"] = coolAction("Projection", "Ctrl+5", "Open "
-                                           "projection plot mode",
-                                           lambda: changePlotMode("Projection"),
-                                           parent=Window)
-    for helpKey in helpKeys:
+    for i, mode in enumerate(modeKeys):
+        Action_Dict[mode] = coolAction(mode, f"Ctrl+{i+1}", f"Open "
+                                       f"{mode.lower()} plot mode",
+                                       partial(changePlotMode, mode),
+                                       parent=Window)
+    for helpKey in PlotHelpKeys:
         Action_Dict[helpKey] = coolAction(f"Help on {helpKey}", statusTip="Ope"
                                           f"n help window for {helpKey}",
                                           parent=Window, helpKey=helpKey)
-    helpKeys.append("FAQ")
     Action_Dict["FAQ"] = coolAction("FAQ", statusTip="Open answers to some"
                                     "frequently asked questions",
                                     parent=Window, helpKey="FAQ")
 
     mainMenu = Window.menuBar()
-    mainMenu.setStyleSheet("""
-QMenuBar {
-background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f6f7fa,
-stop: 1 #dadbde); border-style: outset; border-width: 1px; border-radius: 0px;
-border-color: gray
-}
-QMenuBar::item {
-    spacing: 3px; /* spacing between menu bar items */
-    padding: 1px 4px;
-    background: transparent;
-    border-radius: 2px;
-}
-QMenuBar::item:selected { /* when selected using mouse or keyboard */
-    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop:
-        0 rgb(240, 240, 255), stop: 1 rgb(200, 200, 200))
-}
-QMenuBar::item:pressed {
-    background-color:
-    qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop:
-    0 rgb(200, 200, 200), stop: 1 rgb(140, 140, 140))
-}
-""")
+    if mainMenu.styleSheet() != MenuBarStyle:
+        mainMenu.setStyleSheet(MenuBarStyle)
     fileMenu = mainMenu.addMenu("&Program")
-    for actionKey in ["OpenFile", "OpenDir", "CreatePlot", "Exit"]:
+    for actionKey in ["OpenFile", "OpenDir", "CreatePlot", "ClearDSCache",
+                      "Exit"]:
         fileMenu.addAction(Action_Dict[actionKey])
     plotMenu = mainMenu.addMenu("&Plotting")
     for modeKey in modeKeys:
@@ -460,6 +523,6 @@ QMenuBar::item:pressed {
     optionMenu.addAction(Action_Dict["ConfigOptions"])
     optionMenu.addAction(Action_Dict["LogOptions"])
     helpMenu = mainMenu.addMenu("&Help")
-    for helpKey in helpKeys:
+    for helpKey in PlotHelpKeys + ("FAQ",):
         helpMenu.addAction(Action_Dict[helpKey])
     return Action_Dict
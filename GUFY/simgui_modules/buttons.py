@@ -15,8 +15,13 @@ Module containing all commands used for the creation of the buttons
 
 
 import PyQt5.QtWidgets as QW
-import PyQt5.QtGui as QG
-from simgui_modules.helpWindows import HelpWindow
+from simgui_modules.helpWindows import showHelpWindow
+from simgui_modules.utils import getIcon
+
+
+# The style sheets are shared between buttons with the same style so they
+# don't need to be formatted for each of them
+ButtonStyles = {}
 
 
 class coolButton(QW.QPushButton):
@@ -33,7 +38,22 @@ class coolButton(QW.QPushButton):
                        borderColor="100, 100, 100", bold="", height=20):
         """Sets the background and border color of the button and turns its
         text bold if requested."""
-        self.setStyleSheet(
+        key = (backStart, backStop, borderColor, bold, height)
+        if key not in ButtonStyles:
+            ButtonStyles[key] = createButtonStyle(*key)
+        self.setStyleSheet(ButtonStyles[key])
+
+    def makeTextBold(self, height=20):
+        self.setButtonStyle(bold="bold", height=height)
+
+    def makeButtonRed(self):
+        self.setButtonStyle(borderColor="255, 0, 0", bold="bold")
+
+
+def createButtonStyle(backStart, backStop, borderColor, bold, height):
+    """Returns the style sheet for a coolButton with the given background
+    and border colors, font weight and height."""
+    return (
 f"""QPushButton {{height: {height}px; background-color: 
 qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 {backStart}, stop: 1 {backStop});
 border-style: outset; border-width: 2px; border-radius: 5px; 
@@ -45,12 +65,6 @@ QPushButton:pressed {{background-color:
 qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop:
 0 rgb(200, 200, 200), stop: 1 rgb(140, 140, 140))}}""")
 
-    def makeTextBold(self, height=20):
-        self.setButtonStyle(bold="bold", height=height)
-
-    def makeButtonRed(self):
-        self.setButtonStyle(borderColor="255, 0, 0", bold="bold")
-
 
 class HelpButton(coolButton):
     """A button that can be used to call a help window"""
@@ -59,7 +73,7 @@ class HelpButton(coolButton):
                          "plot mode", enabled=True)
         self.makeTextBold(height=12)
         self.clicked.connect(lambda: print("This is a dummy connection"))
-        icon = QG.QIcon("simgui_registry/Icons/questionmark.png")
+        icon = getIcon("simgui_registry/Icons/questionmark.png")
         self.setIcon(icon)
 
     def setToHelp(self, key):
@@ -69,8 +83,7 @@ class HelpButton(coolButton):
 
     def openHelpWindow(self, key):
         """Opens a help window"""
-        self.helpWindow = HelpWindow(key, parent=self.parent().parent().parent().parent())
-        self.helpWindow.show()
+        self.helpWindow = showHelpWindow(key, parent=self.parent().parent().parent().parent())
 
 
 # %% Buttons
@@ -164,7 +177,7 @@ class extremaButton(coolButton):
         self.clicked.connect(lambda: Param_Dict["SignalHandler"].setExtrema(axis))
 
     def setToRecalculate(self, axis, Window):
-        self.setIcon(QG.QIcon("simgui_registry/Icons/Recalculate.png"))
+        self.setIcon(getIcon("simgui_registry/Icons/Recalculate.png"))
         self.setToolTip("Calculate the global extrema for this field or recalc"
                         "ulate them for the current dataset")
         self.clicked.disconnect()
@@ -12,6 +12,7 @@ The full license is in the file LICENSE.txt, distributed with this software.
 
 Module containing all commands used for the creation of the combo boxes
 """
+from functools import partial
 import PyQt5.QtGui as QG
 import PyQt5.QtCore as QC
 import PyQt5.QtWidgets as QW
@@ -19,6 +20,11 @@ import yt
 import simgui_modules.lineEdits as LE
 
 
+# The style sheets are shared between boxes with the same list width so they
+# don't need to be formatted for each of them
+ComboBoxStyles = {}
+
+
 class coolComboBox(QW.QComboBox):
     """Modified version of QComboBoxes.
     params:
@@ -28,14 +34,24 @@ class coolComboBox(QW.QComboBox):
     def __init__(self, items, tooltip=None, width=200):
         super().__init__()
         self.addItems(items)
-        self.setToolTip(tooltip)
+        if tooltip:
+            self.setToolTip(tooltip)
         self.setListWidth(200)
         if width is not None:
             self.setFixedWidth(width)
 
     def setListWidth(self, width):
         """Set the width of the ListView to with in pixels"""
-        self.setStyleSheet(f"""
+        if width not in ComboBoxStyles:
+            ComboBoxStyles[width] = createComboBoxStyle(width)
+        if self.styleSheet() != ComboBoxStyles[width]:  # Avoid reparsing
+            self.setStyleSheet(ComboBoxStyles[width])
+
+
+def createComboBoxStyle(width):
+    """Returns the style sheet for a coolComboBox with a ListView of the
+    given width."""
+    return (f"""
         QComboBox {{background-color: qlineargradient(x1: 0, y1: 0, 
         x2: 0, y2: 1, stop: 0 #f6f7fa, stop: 1 #dadbde); font: bold 12px;
         border: 2px solid gray; border-radius: 2px;
@@ -48,7 +64,6 @@ class coolComboBox(QW.QComboBox):
         QComboBox:hover {{border-color: rgb(79,148,205)}}
         QComboBox QListView {{min-height: 100px;background-color: solid gray;
         border: 2px solid gray; min-width: {width}px;}}""")
-        
 
 
 # %% Creation
@@ -65,12 +80,12 @@ def createAllComboBoxes(Param_Dict, ComboBox_Dict):
     ComboBox_Dict["TimeQuantity"] = createTimeQuantityBox()
     # Iterating would produce weird errors.
     hand = Param_Dict["SignalHandler"]
-    ComboBox_Dict["XAxis"].currentIndexChanged.connect(lambda: hand.getAxisInput("X"))
-    ComboBox_Dict["YAxis"].currentIndexChanged.connect(lambda: hand.getAxisInput("Y"))
-    ComboBox_Dict["ZAxis"].currentIndexChanged.connect(lambda: hand.getAxisInput("Z"))
-    ComboBox_Dict["NAxis"].currentIndexChanged.connect(lambda: hand.getAxisInput("N"))
-    ComboBox_Dict["YWeight"].currentIndexChanged.connect(lambda: hand.getWeightField("Y"))
-    ComboBox_Dict["ZWeight"].currentIndexChanged.connect(lambda: hand.getWeightField("Z"))
+    ComboBox_Dict["XAxis"].currentIndexChanged.connect(partial(hand.getAxisInput, "X"))
+    ComboBox_Dict["YAxis"].currentIndexChanged.connect(partial(hand.getAxisInput, "Y"))
+    ComboBox_Dict["ZAxis"].currentIndexChanged.connect(partial(hand.getAxisInput, "Z"))
+    ComboBox_Dict["NAxis"].currentIndexChanged.connect(partial(hand.getAxisInput, "N"))
+    ComboBox_Dict["YWeight"].currentIndexChanged.connect(partial(hand.getWeightField, "Y"))
+    ComboBox_Dict["ZWeight"].currentIndexChanged.connect(partial(hand.getWeightField, "Z"))
     ComboBox_Dict["TimeQuantity"].currentIndexChanged.connect(lambda: hand.getTimeQuantityInput())
 
 
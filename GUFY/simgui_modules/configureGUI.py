@@ -14,26 +14,52 @@ A module containing some options for configuring everything.
 """
 
 
-import inspect
 import os
 import logging
-from configparser import ConfigParser, NoOptionError
+from configparser import ConfigParser
+from functools import partial
 import PyQt5.QtWidgets as QW
 import PyQt5.QtCore as QC
 import PyQt5.QtGui as QG
 from yt import YTQuantity
+from yt.units.unit_object import UnitParseError
 from simgui_modules.buttons import coolButton
-from simgui_modules.checkBoxes import coolCheckBox, createAnnotationBoxes
+from simgui_modules.checkBoxes import coolCheckBox, createAnnotationBoxes, \
+    AnnotationKeys, AnnotationSpecs
 from simgui_modules.comboBoxes import createTimeQuantityBox, createWeightBoxes
 from simgui_modules.lineEdits import createColorSchemeEdit, coolEdit, \
     validColors
 from simgui_modules.logging import LoggingOptionsDialog
+from simgui_modules.utils import pausedUpdates
 
 GUILogger = logging.getLogger("GUI")
 ytLogger = logging.getLogger("yt")
+# Reference unit the grid unit input is compared to
+GridReferenceUnit = YTQuantity(1, "au").units
 # Load the configuration file
 config = ConfigParser()
 config.read("simgui_registry/GUIconfig.ini")
+# The CheckBox defaults are parsed once here instead of for every CheckBox.
+# The keys are lower case like in the config file.
+CheckBoxDefaults = {}
+
+
+def updateCheckBoxDefaults():
+    """Parses the CheckBoxes section of the config into CheckBoxDefaults."""
+    CheckBoxDefaults.clear()
+    for key in config["CheckBoxes"]:
+        CheckBoxDefaults[key] = config.getboolean("CheckBoxes", key)
+
+
+updateCheckBoxDefaults()
+
+
+# Keys of the CheckBoxes in the ConfigDialog. The annotation boxes are
+# displayed sorted by their keys.
+SortedAnnoKeys = tuple(sorted(spec[0] for spec in AnnotationSpecs))
+OtherKeys = ("XLog", "YLog", "ZLog", "SetAspect", "QuitDialog")
+OtherTexts = ("Log horizontal axis", "Log vertical axis", "Log color bar axis",
+              "Ignore aspect ratio", "Warn me before quitting")
 
 
 class ConfigDialog(QW.QDialog):
@@ -45,6 +71,7 @@ class ConfigDialog(QW.QDialog):
         super().__init__(parent)
         self.Param_Dict = Param_Dict
         self.Misc_Dict = Misc_Dict
+        self.GUIMisc_Dict = Misc_Dict  # self.Misc_Dict is replaced in createMiscs
         self.Config_Dict = {}
         self.setWindowFlags(  # Set minimize, maximize and close button
                             QC.Qt.Window |
@@ -78,11 +105,14 @@ class ConfigDialog(QW.QDialog):
         self.directoryLabel = QW.QLabel(f'Current home directory:\n{self.homeDir}')
         self.directoryButton = coolButton(text="Set home directory",
                                           tooltip="Set the new home directory")
+        # The logging options are only created once their tab is opened
+        self.tabWidget = QW.QTabWidget()
+        self.tabWidget.addTab(self.createCheckBoxes(), "CheckBoxes")
+        self.tabWidget.addTab(self.createLoggings(), "Logging")
         layout = QW.QGridLayout()
         layout.addWidget(self.textBrowser, 0, 0)
-        layout.addWidget(self.createCheckBoxes(), 0, 1)
-        layout.addWidget(self.createLoggings(), 2, 0)
-        layout.addWidget(self.createMiscs(), 2, 1)
+        layout.addWidget(self.tabWidget, 0, 1, 3, 1)
+        layout.addWidget(self.createMiscs(), 2, 0)
         layout.addWidget(self.directoryLabel, 3, 0, 1, 2)
         layout.addWidget(self.directoryButton, 4, 0, 1, 2)
         layout.addWidget(self.buttonBox, 5, 1)
@@ -98,49 +128,50 @@ class ConfigDialog(QW.QDialog):
         annoLayout = QW.QVBoxLayout(annoWid)
         annoLayout.setSpacing(3)
         annoLayout.addWidget(QW.QLabel("Annotations: "))
-        annoKeys = ["Timestamp", "Scale", "Grid",
-                    "VelVectors", "VelStreamlines",
-                    "MagVectors", "MagStreamlines", "Contour", "Particleanno",
-                    "LineAnno"]
-        annoBoxes = createAnnotationBoxes(width=None, defaultString="default ")
-        self.CheckBox_Dict = dict(zip(annoKeys, annoBoxes))
-        for key in sorted(annoKeys):
+        # The defaults are shown in the native style, which is cheaper to
+        # update than the style sheet with its images
+        self.CheckBox_Dict = createAnnotationBoxes(width=None,
+                                                   defaultString="default ",
+                                                   styled=False)
+        for key in SortedAnnoKeys:
             annoLayout.addWidget(self.CheckBox_Dict[key])
         annoLayout.addStretch(1)
         miscWid = QW.QWidget()
         miscLayout = QW.QVBoxLayout(miscWid)
         miscLayout.setSpacing(3)
         miscLayout.addWidget(QW.QLabel("Miscellaneous: "))
-        otherKeys = ["XLog", "YLog", "ZLog", "SetAspect", "QuitDialog"]
-        otherTexts = ["Log horizontal axis", "Log vertical axis",
-                      "Log color bar axis",
-                      "Ignore aspect ratio",
-                      "Warn me before quitting"]
-        for key, text in zip(otherKeys, otherTexts):
+        for key, text in zip(OtherKeys, OtherTexts):
             checkBox = coolCheckBox(text, f"Toggle {text.lower()} default",
-                                    width=None)
+                                    width=None, styled=False)
             self.CheckBox_Dict[key] = checkBox
             if key == "QuitDialog":
                 miscLayout.addStretch(1)
             miscLayout.addWidget(checkBox)
         for key in self.CheckBox_Dict.keys():
-            self.CheckBox_Dict[key].setChecked(config.getboolean("CheckBoxes", key))
+            self.CheckBox_Dict[key].setChecked(CheckBoxDefaults.get(key.lower(), False))
         mainLayout.addWidget(annoWid)
         mainLayout.addWidget(miscWid)
         wid.setMinimumWidth(400)
         return wid
 
     def createLoggings(self):
-        """Creates a group box for logging options"""
+        """Creates a group box for logging options. The options themselves are
+        added by addLogDialog once the group box is shown."""
         wid = QW.QGroupBox("Logging defaults")
-        layout = QW.QVBoxLayout(wid)
-        layout.setSpacing(3)
-        layout.setContentsMargins(3, 3, 3, 3)
-        self.LogDialog = LoggingOptionsDialog(self.Misc_Dict, parent=self,
-                                              configDialog=True)
-        layout.addWidget(self.LogDialog)
+        self.logLayout = QW.QVBoxLayout(wid)
+        self.logLayout.setSpacing(3)
+        self.logLayout.setContentsMargins(3, 3, 3, 3)
+        self.LogDialog = None
         return wid
 
+    def addLogDialog(self, index):
+        """Creates the logging options the first time their tab is selected"""
+        if self.LogDialog is None and self.tabWidget.tabText(index) == "Logging":
+            self.LogDialog = LoggingOptionsDialog(self.GUIMisc_Dict,
+                                                  parent=self,
+                                                  configDialog=True)
+            self.logLayout.addWidget(self.LogDialog)
+
     def createMiscs(self):
         """Creates a group box with all relevant Misc items on it, and stores
         them in Misc_Dict"""
@@ -174,24 +205,13 @@ class ConfigDialog(QW.QDialog):
         self.buttonBox.accepted.connect(self.saveSettings)
         self.buttonBox.rejected.connect(self.cancelPressed)
         self.directoryButton.clicked.connect(self.getHomeDir)
+        self.tabWidget.currentChanged.connect(self.addLogDialog)
         self.Misc_Dict["colorscheme"].textChanged.connect(self.getColorInput)
         self.Misc_Dict["gridunit"].textChanged.connect(self.getGridInput)
-        self.Misc_Dict["timequantity"].currentIndexChanged.connect(lambda: self.getComboInput("timequantity"))
-        self.Misc_Dict["weightfield"].currentIndexChanged.connect(lambda: self.getComboInput("weightfield"))
-        self.CheckBox_Dict["Timestamp"].toggled.connect(lambda state: self.getStateInput("Timestamp", state))
-        self.CheckBox_Dict["Scale"].toggled.connect(lambda state: self.getStateInput("Scale", state))
-        self.CheckBox_Dict["Grid"].toggled.connect(lambda state: self.getStateInput("Grid", state))
-        self.CheckBox_Dict["Contour"].toggled.connect(lambda state: self.getStateInput("Contour", state))
-        self.CheckBox_Dict["VelVectors"].toggled.connect(lambda state: self.getStateInput("VelVectors", state))
-        self.CheckBox_Dict["VelStreamlines"].toggled.connect(lambda state: self.getStateInput("VelStreamlines", state))
-        self.CheckBox_Dict["MagVectors"].toggled.connect(lambda state: self.getStateInput("MagVectors", state))
-        self.CheckBox_Dict["MagStreamlines"].toggled.connect(lambda state: self.getStateInput("MagStreamlines", state))
-        self.CheckBox_Dict["LineAnno"].toggled.connect(lambda state: self.getStateInput("LineAnno", state))
-        self.CheckBox_Dict["XLog"].toggled.connect(lambda state: self.getStateInput("XLog", state))
-        self.CheckBox_Dict["YLog"].toggled.connect(lambda state: self.getStateInput("YLog", state))
-        self.CheckBox_Dict["ZLog"].toggled.connect(lambda state: self.getStateInput("ZLog", state))
-        self.CheckBox_Dict["SetAspect"].toggled.connect(lambda state: self.getStateInput("SetAspect", state))
-        self.CheckBox_Dict["QuitDialog"].toggled.connect(lambda state: self.getStateInput("QuitDialog", state))
+        self.Misc_Dict["timequantity"].currentIndexChanged.connect(partial(self.getComboInput, "timequantity"))
+        self.Misc_Dict["weightfield"].currentIndexChanged.connect(partial(self.getComboInput, "weightfield"))
+        for key, checkBox in self.CheckBox_Dict.items():
+            checkBox.toggled.connect(partial(self.getStateInput, key))
 
     def getStateInput(self, key, state):
         """Store the CheckBox input as a string that can be saved in the config
@@ -201,6 +221,7 @@ class ConfigDialog(QW.QDialog):
             boolString = "yes"
         self.Config_Dict["CheckBoxes_" + key] = boolString
 
+    @QC.pyqtSlot(str)
     def getColorInput(self, text):
         """Read out the input of the color scheme and give feedback if it is
         valid"""
@@ -211,15 +232,15 @@ class ConfigDialog(QW.QDialog):
             self.Misc_Dict["colorscheme"].turnTextBlack()
             self.Config_Dict["Misc_colorscheme"] = text
 
-    def getComboInput(self, key):
-        """Read out the input of the time quantity"""
+    def getComboInput(self, key, index=None):
+        """Read out the input of the time quantity or weight field box. index
+        is passed by currentIndexChanged and not needed."""
         self.Config_Dict[f"Misc_{key}"] = self.Misc_Dict[key].currentText()
 
+    @QC.pyqtSlot(str)
     def getGridInput(self, text):
         """Read out grid unit input and give feedback"""
-        # reference unit
-        fieldUnit = YTQuantity(1, "au").units
-        from yt.units.unit_object import UnitParseError
+        fieldUnit = GridReferenceUnit
         lineEdit = self.Misc_Dict["gridunit"]
         try:
             textUnit = YTQuantity(1, text).units
@@ -245,17 +266,19 @@ class ConfigDialog(QW.QDialog):
 
     def saveSettings(self):
         """Handles the saving operations"""
-        config["Path"]["homedir"] = self.homeDir
-        config["Logging"]["yt"] = str(self.LogDialog.ytInput)
-        config["Logging"]["GUI"] = str(self.LogDialog.GUIInput)
-        config["Logging"]["MaxBlocks"] = str(self.LogDialog.blockCount)
+        # Collect all of the changes so they are applied to the config at once
+        updates = {"Path": {"homedir": self.homeDir}}
+        if self.LogDialog is not None:  # otherwise nothing has changed
+            updates["Logging"] = {"yt": str(self.LogDialog.ytInput),
+                                  "GUI": str(self.LogDialog.GUIInput),
+                                  "MaxBlocks": str(self.LogDialog.blockCount)}
         if not self.Param_Dict["isValidFile"]:  # only if no file is loaded
             self.Param_Dict["Directory"] = self.homeDir
             self.parent().Status_Dict["Dir"].setText(self.homeDir)
-        for key in self.Config_Dict.keys():
-            group = key.split("_")[0]
-            subkey = key.split("_")[1]
-            config[group][subkey] = self.Config_Dict[key]
+        for key, value in self.Config_Dict.items():
+            group, subkey = key.split("_", 1)
+            updates.setdefault(group, {})[subkey] = value
+        config.read_dict(updates)
         saveConfigOptions(log=True)
         self.accept()
 
@@ -273,11 +296,8 @@ def getHomeDirectory():
         directory: str: The working directory"""
     directory = config["Path"]["homedir"]
     if directory == "" or not os.path.isdir(directory):
-        # https://stackoverflow.com/questions/3718657/how-to-properly-determine-current-script-directory
-        filename = inspect.getframeinfo(inspect.currentframe()).filename
-        moduleDir = os.path.dirname(os.path.abspath(filename))
-        # some string formatting to remove the last bit:
-        directory = "\\".join(moduleDir.split("\\")[:-1])
+        # The parent directory of simgui_modules:
+        directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         GUILogger.info("Couldn't locate home directory. Default directory is "
                        "set to the directory the program was started in.")
     return directory
@@ -286,32 +306,40 @@ def getHomeDirectory():
 def loadConfigOptions(Window):
     """Sets the widgets according to the settings given through the config
     file"""
-    text = config["Misc"]["colorscheme"]
-    Window.Edit_Dict["ColorScheme"].setText(text)
-    Window.Edit_Dict["ColorScheme"].setPlaceholderText(text)
-    text = config["Misc"]["gridunit"]
-    Window.Edit_Dict["GridUnit"].setText(text)
-    Window.Edit_Dict["GridUnit"].setPlaceholderText(text)
-    text = config["Misc"]["timequantity"]
-    Window.ComboBox_Dict["TimeQuantity"].setCurrentText(text)
-    text = config["Misc"]["weightfield"]
-    Window.ComboBox_Dict["YWeight"].setCurrentText(text)
-    Window.Misc_Dict["LogBox"].document().setMaximumBlockCount(config.getint("Logging", "MaxBlocks"))
+    Misc = dict(config["Misc"])
+    maxBlocks = config.getint("Logging", "MaxBlocks")
     GUILogger.setLevel(config.getint("Logging", "GUI"))
     ytLogger.setLevel(config.getint("Logging", "yt"))
+    with pausedUpdates(Window):  # Only repaint once everything is set
+        for key, editKey in [("colorscheme", "ColorScheme"),
+                             ("gridunit", "GridUnit")]:
+            Window.Edit_Dict[editKey].setText(Misc[key])
+            Window.Edit_Dict[editKey].setPlaceholderText(Misc[key])
+        Window.ComboBox_Dict["TimeQuantity"].setCurrentText(Misc["timequantity"])
+        Window.ComboBox_Dict["YWeight"].setCurrentText(Misc["weightfield"])
+        Window.Misc_Dict["LogBox"].document().setMaximumBlockCount(maxBlocks)
+        # Only the boxes that have a default in the config are set
+        boxKeys = {key.lower(): key for key in Window.CheckBox_Dict}
+        for lowerKey in boxKeys.keys() & CheckBoxDefaults.keys():
+            key = boxKeys[lowerKey]
+            checkBox = Window.CheckBox_Dict[key]
+            if key in AnnotationKeys:
+                # Their slot would only store the state, so we do it directly
+                checkBox.blockSignals(True)
+                checkBox.setChecked(CheckBoxDefaults[lowerKey])
+                checkBox.blockSignals(False)
+                Window.Param_Dict[key] = checkBox.isChecked()
+            else:  # The others need their slots to update other widgets
+                checkBox.setChecked(CheckBoxDefaults[lowerKey])
     GUILogger.info("Logs and additional Information will be displayed here.")
     GUILogger.log(29, "You can <b>change the logging level</b> by pressing <i>ctrl + L</i> or in the <i>Options</i> menu.")
     GUILogger.info("Please open a (FLASH-)simulation file or a time series to get started.")
-    for key in Window.CheckBox_Dict.keys():
-        try:
-            Window.CheckBox_Dict[key].setChecked(config.getboolean("CheckBoxes", key))
-        except NoOptionError:
-            pass
 
 
 def saveConfigOptions(log=False):
     """Convenience method to store the config options in the config file."""
     with open("simgui_registry/GUIconfig.ini", "w") as configfile:
         config.write(configfile)
+    updateCheckBoxDefaults()
     if log:
         GUILogger.log(29, "New configuration settings have successfully been stored.")
@@ -15,6 +15,11 @@ widget
 """
 
 
+import ast
+import builtins
+import keyword
+import os
+from functools import lru_cache, partial
 import numpy as np  # This way the user can use numpy inside of the function definition
 import PyQt5.QtWidgets as QW
 import PyQt5.QtGui as QG
@@ -23,13 +28,164 @@ import yt
 from yt.units.unit_registry import UnitParseError
 from simgui_modules.checkBoxes import coolCheckBox
 from simgui_modules.lineEdits import coolEdit
-from simgui_modules.helpWindows import HelpWindow
+from simgui_modules.helpWindows import showHelpWindow
 from simgui_modules.additionalWidgets import GUILogger
-from simgui_modules.utils import alertUser
-# For the string transformation:
-from pygments import highlight
-from pygments.lexers import Python3Lexer
-from pygments.formatters import HtmlFormatter
+from simgui_modules.utils import alertUser, LazyDataSeries, findSeriesFiles, \
+    loadDataSet
+from simgui_modules.threading import startWorker
+
+
+# The statements that may be used outside of the function
+AllowedTopLevelNodes = (ast.FunctionDef, ast.Import, ast.ImportFrom,
+                        ast.Assign)
+
+
+@lru_cache(maxsize=32)
+def compileFieldCode(text):
+    """Compiles the code of a derived field function. The code object is
+    cached so the same text doesn't need to be compiled again when it's read
+    after being validated.
+    Since the code is executed for each validation, it may only contain
+    function definitions, imports, assignments and docstrings at the top
+    level. This is checked on the parsed code before anything is executed."""
+    tree = ast.parse(text, "<string>")
+    for node in tree.body:
+        if isinstance(node, AllowedTopLevelNodes):
+            continue
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            continue  # docstrings and other constants
+        raise SyntaxError("only function definitions, imports and assignments "
+                          f"are allowed outside of the function (line {node.lineno})")
+    return compile(tree, "<string>", "exec")
+
+
+def createFieldNamespace():
+    """Returns the namespace the derived field functions are executed in,
+    where numpy, yt and the GUILogger can be used as stated in the help."""
+    return {"np": np, "yt": yt, "GUILogger": GUILogger}
+
+
+class DryRunData(dict):
+    """Stands in for the data object when a field function is called to get
+    the units of its output. Each field is a single one with the units of the
+    field, so nothing has to be read from the dataset.
+    The units are collected from the field info right away and only the unit
+    registry is kept, so the dataset itself can't be reached from the field
+    function when the dry run is done in a worker thread. Functions that need
+    data.ds fail the dry run and are called on the sample data instead.
+    Parameters:
+        ds: the dataset to take the units of the fields from
+    """
+    def __init__(self, ds):
+        super().__init__()
+        self.registry = ds.unit_registry
+        self.fieldUnits = {}
+        for (ftype, fname), fieldInfo in ds.field_info.items():
+            self.fieldUnits[(ftype, fname)] = fieldInfo.units
+            if fname not in self.fieldUnits or ftype == "gas":
+                self.fieldUnits[fname] = fieldInfo.units
+
+    def __missing__(self, key):
+        value = yt.YTArray(np.ones(1), self.fieldUnits[key],
+                           registry=self.registry)
+        self[key] = value
+        return value
+
+
+FieldPlaceholder = "Hello, I'm a fancy placeholder, why did you call me?"
+
+
+def getDryRunUnits(fieldFunction, dryData):
+    """Calls the field function once on dryData to catch errors that only
+    show up at runtime, i.e. nameErrors, and returns the units of the output.
+    This is run in a worker thread, so dryData only holds the unit registry
+    and never the dataset itself."""
+    return fieldFunction(FieldPlaceholder, dryData).units
+
+
+def getFunctionUnits(fieldFunction, sp):
+    """Calls the field function on the data object sp and returns the units
+    of the output. This is the fallback if the dry run doesn't work, i.e.
+    the function needs more than the fields, and has to be run in the main
+    thread since yt isn't thread-safe."""
+    return fieldFunction(FieldPlaceholder, sp).units
+
+
+# The validator for field names is shared by all dialogs
+FieldNameValidator = QG.QRegExpValidator(QC.QRegExp("[a-zA-Z_]*"))
+
+
+def createTextFormat(color, bold=False, italic=False):
+    """Returns a QTextCharFormat with the given color (hex string)"""
+    textFormat = QG.QTextCharFormat()
+    textFormat.setForeground(QG.QColor(color))
+    if bold:
+        textFormat.setFontWeight(QG.QFont.Bold)
+    if italic:
+        textFormat.setFontItalic(True)
+    return textFormat
+
+
+class pythonHighlighter(QG.QSyntaxHighlighter):
+    """Highlights python code in the style pygments uses by default. Qt only
+    calls highlightBlock for the lines that have changed, so the document
+    doesn't need to be rebuilt for every change.
+    Parameters:
+        document: QTextDocument to highlight
+    """
+    StringFormat = createTextFormat("#BA2121")
+    # (QRegExp, format, index of the group to format). Later rules override
+    # the formats of the earlier ones.
+    Rules = [(QC.QRegExp(r"\b(?:{})\b".format("|".join(
+                  name for name in dir(builtins) if not name.startswith("_")))),
+              createTextFormat("#008000"), 0),
+             (QC.QRegExp(r"\b(?:{})\b".format("|".join(keyword.kwlist))),
+              createTextFormat("#008000", bold=True), 0),
+             (QC.QRegExp(r"\bdef\s+(\w+)"), createTextFormat("#0000FF"), 1),
+             (QC.QRegExp(r"\b[0-9]+\.?[0-9]*(?:[eE][+-]?[0-9]+)?\b"),
+              createTextFormat("#666666"), 0),
+             (QC.QRegExp(r'"[^"\\]*(?:\\.[^"\\]*)*"'), StringFormat, 0),
+             (QC.QRegExp(r"'[^'\\]*(?:\\.[^'\\]*)*'"), StringFormat, 0),
+             (QC.QRegExp(r"#[^\n]*"),
+              createTextFormat("#408080", italic=True), 0)]
+
+    def highlightBlock(self, text):
+        """Formats the line given by text"""
+        for regExp, textFormat, group in self.Rules:
+            index = regExp.indexIn(text)
+            while index >= 0:
+                length = regExp.matchedLength()
+                self.setFormat(regExp.pos(group), len(regExp.cap(group)),
+                               textFormat)
+                index = regExp.indexIn(text, index + length)
+        self.setCurrentBlockState(0)
+        # Docstrings may span multiple lines
+        if not self.formatMultiline(text, '"""', 1):
+            self.formatMultiline(text, "'''", 2)
+
+    def formatMultiline(self, text, delimiter, state):
+        """Formats the parts of text inside of triple quotes given by
+        delimiter. The block state is used to remember if the string
+        continues on the next line.
+        returns:
+            bool: whether the string is still open at the end of the line
+        """
+        if self.previousBlockState() == state:
+            start, offset = 0, 0
+        else:
+            start, offset = text.find(delimiter), len(delimiter)
+        while start >= 0:
+            end = text.find(delimiter, start + offset)
+            if end >= 0:
+                length = end - start + len(delimiter)
+                self.setCurrentBlockState(0)
+            else:
+                length = len(text) - start
+                self.setCurrentBlockState(state)
+            self.setFormat(start, length, self.StringFormat)
+            start = text.find(delimiter, start + length)
+            offset = len(delimiter)
+        return self.currentBlockState() == state
 
 
 def getDerFieldInfo(Param_Dict, ComboBox_Dict, Misc_Dict, dialog):
@@ -46,29 +202,28 @@ def getDerFieldInfo(Param_Dict, ComboBox_Dict, Misc_Dict, dialog):
         dim = "dimensionless"
     text = dialog.functionText
     # Add the field to the known fields in Param_Dict and comboboxes:
-    for axis in ["X", "Y", "Z"]:
-        Param_Dict[axis + "Fields"].insert(3, fieldName)
-        ComboBox_Dict[axis + "Axis"].insertItem(3, fieldName)
-        if axis != "X":
-            ComboBox_Dict[axis + "Weight"].insertItem(3, fieldName)
-    Param_Dict["WeightFields"].insert(3, fieldName)
+    for key in ["XFields", "YFields", "ZFields", "WeightFields"]:
+        Param_Dict[key].insert(3, fieldName)
+    # The current selections aren't changed by the insertion, so the signals
+    # are blocked and each box is only repainted once
+    for key in ["XAxis", "YAxis", "ZAxis", "YWeight", "ZWeight"]:
+        comboBox = ComboBox_Dict[key]
+        comboBox.blockSignals(True)
+        comboBox.insertItem(3, fieldName)
+        comboBox.blockSignals(False)
+        comboBox.update()
     yt.add_field(("gas", fieldName), function=fieldFunction,
                  units=unit, dimensions=dim, force_override=override,
                  display_name=displayName, take_log=False)
     reloadFiles(Param_Dict, Misc_Dict)
     # Save the parameters in Param_Dict for the ScriptWriting function
-    Param_Dict["NewDerFieldDict"][fieldName] = {}
-    Param_Dict["NewDerFieldDict"][fieldName]["Override"] = override
-    Param_Dict["NewDerFieldDict"][fieldName]["DisplayName"] = displayName
-    Param_Dict["NewDerFieldDict"][fieldName]["FunctionText"] = text
-    if unit == "auto":
-        Param_Dict["NewDerFieldDict"][fieldName]["Unit"] = dialog.baseUnit
-    else:
-        Param_Dict["NewDerFieldDict"][fieldName]["Unit"] = unit
-    Param_Dict["NewDerFieldDict"][fieldName]["Dimensions"] = dim
-    if unit == "auto":
-        unit = fieldFunction("Hello, I'm a fancy placeholder, why did you \
-                             call me?", dialog.sp).units
+    if unit == "auto":  # The function has already been called by the dialog
+        unit = dialog.baseUnit
+    Param_Dict["NewDerFieldDict"][fieldName] = {"Override": override,
+                                                "DisplayName": displayName,
+                                                "FunctionText": text,
+                                                "Unit": unit,
+                                                "Dimensions": dim}
     ds = Param_Dict["CurrentDataSet"]
     Param_Dict["FieldUnits"][fieldName] = yt.YTQuantity(ds.arr(1, unit)).units
     GUILogger.log(29, f"The new field <b>{fieldName}</b> with {dim}-dimension \
@@ -81,12 +236,19 @@ def reloadFiles(Param_Dict, Misc_Dict):
     """After the field has been added, the file or the series have to be
     reloaded."""
     GUILogger.info("Reloading all files so they now about this field.")
+    # The datasets loaded so far don't know about the new field
+    Param_Dict["ClearDSCache"]()
     if Param_Dict["isValidSeries"]:
-        ts = yt.load(Param_Dict["Directory"] + '/' + Param_Dict["Seriesname"])
-        Param_Dict["DataSeries"] = ts
+        # Only the file names are reused, the datasets are loaded lazily and
+        # anew so they know about the new field
+        directory = Param_Dict["Directory"]
+        filenames = findSeriesFiles(directory + '/' + Param_Dict["Seriesname"],
+                                    os.path.getmtime(directory))
+        Param_Dict["DataSeries"] = LazyDataSeries(filenames)
         Misc_Dict["SeriesSlider"].valueChanged.emit(Misc_Dict["SeriesSlider"].value())
     else:
-        Param_Dict["SingleDataSet"] = yt.load(Param_Dict["Filename"])
+        # This is done right away so the old dataset can't be plotted anymore
+        Param_Dict["SingleDataSet"] = loadDataSet(Param_Dict["Filename"])
         Param_Dict["CurrentDataSet"] = Param_Dict["SingleDataSet"]
 
 
@@ -102,8 +264,10 @@ class AskFieldDialog(QW.QDialog):
     def __init__(self, fieldList, ds, parent):
         super().__init__(parent=parent)
         GUILogger.info("Adding a new derived field. Press the 'Help'-button for more info.")
-        self.fieldList = fieldList
+        # The names are only looked up, which is quicker in a frozenset
+        self.fieldList = frozenset(fieldList)
         self.fieldName = ""
+        self.defLine = "def _(field, data):"  # First line of the function
         self.helpDialog = None
         self.setWindowFlags(QC.Qt.Window |
                             QC.Qt.CustomizeWindowHint |
@@ -113,6 +277,14 @@ class AskFieldDialog(QW.QDialog):
                             QC.Qt.WindowCloseButtonHint)
         self.setWindowModality(QC.Qt.WindowModal)  # This way, the user can't interact with main window while this is open
         self.sp = ds.point([0, 0, 0])  # sample data for our tests
+        self.dryData = DryRunData(ds)  # Used before sp to avoid reading data
+        self.unitDimensions = {}  # Cache for the parsed unit inputs
+        self.lastRead = None  # (text, field name) the function was read from
+        self.readCount = 0  # Results of outdated reads are ignored
+        self.readPending = False
+        # Units of the output for (text, field name), so functions that have
+        # already been called on the sample data aren't called again
+        self.functionUnits = {}
         self.initUi()
         self.signalsConnection()
         self.resize(600, 500)
@@ -132,8 +304,7 @@ class AskFieldDialog(QW.QDialog):
         self.fieldNameEdit = coolEdit(placeholder="e.g. dust_to_gas_density_ratio",
                                       tooltip="Internal name for the new field",
                                       width=None, parent=self)
-        nameValidator = QG.QRegExpValidator(QC.QRegExp("[a-zA-Z_]*"))
-        self.fieldNameEdit.setValidator(nameValidator)
+        self.fieldNameEdit.setValidator(FieldNameValidator)
         # A line edit for the display of the field, coming with a label for display:
         self.displayNameEdit = coolEdit(placeholder="e.g. \\rho_{\\rm d}/\\rh"
                                         "o_{\\rm g}",
@@ -170,7 +341,12 @@ class AskFieldDialog(QW.QDialog):
         self.buttonBox.helpRequested.connect(self.helpPressed)
         self.fieldNameEdit.textChanged.connect(self.validateFieldName)
         self.fieldNameEdit.editingFinished.connect(self.setDisplayName)
-        self.unitEdit.textChanged.connect(self.validateUnit)
+        # The unit is only parsed once the user stops typing for a moment
+        self.unitTimer = QC.QTimer(self)
+        self.unitTimer.setSingleShot(True)
+        self.unitTimer.setInterval(120)
+        self.unitTimer.timeout.connect(self.validateUnit)
+        self.unitEdit.textChanged.connect(lambda: self.unitTimer.start())
         self.forceOverrideBox.toggled.connect(self.getOverrideInput)
         self.getOverrideInput(False)
         self.fieldFunctionEdit.editingFinished.connect(self.readFunc)
@@ -185,6 +361,13 @@ class AskFieldDialog(QW.QDialog):
         GUILogger.info("No derived field added.")
 
     def applyPressed(self):
+        if self.readPending:  # The function is still being checked
+            return
+        if self.unitTimer.isActive():  # Make sure the unit has been checked
+            self.unitTimer.stop()
+            self.validateUnit()
+            if not self.unitEdit.isValid:
+                return
         self.functionText = self.fieldFunctionEdit.toPlainText()
         displayText = self.displayNameEdit.text()
         if displayText == "":
@@ -211,36 +394,90 @@ class AskFieldDialog(QW.QDialog):
         self.setDisplayName()
 
     def helpPressed(self):
-        self.helpDialog = HelpWindow("derived fields", parent=self)
+        self.helpDialog = showHelpWindow("derived fields", parent=self)
         x = self.geometry().x() + self.width()
         y = self.geometry().y()
         self.helpDialog.move(x, y)
-        self.helpDialog.show()
 
     def readFunc(self):
         """Read the function given through fieldFunctionEdit if possible and
         get the dimensionality of the output"""
         if self.fieldFunctionEdit.isValid:
             text = self.fieldFunctionEdit.toPlainText()
-            exec(text, globals())  # this will execute the code once more and save
-            self.fieldFunction = eval("_{}".format(self.fieldName))
+            if (text, self.fieldName) == self.lastRead:
+                self.validateUnit()  # The function is already up to date
+                return
+            self.readCount += 1
+            self.lastRead = None  # The function is replaced from now on
             try:
-                # some of the errors haven't been caught so far, i.e. nameErrors
-                unit = self.fieldFunction("Hello, I'm a fancy placeholder, why"
-                                          " did you call me?", self.sp).units
-                self.baseUnit = unit
-                self.dim = unit.dimensions
-                self.unitEdit.setPlaceholderText(str(unit))
-                if self.unitEdit.text() == "":
-                    self.unitEdit.setText(str(unit))
-                self.unitEdit.setToolTip("Set the default units to {}-dimension".format(self.dim))
+                # this will execute the code once more and save the function
+                namespace = createFieldNamespace()
+                exec(compileFieldCode(text), namespace)
+                self.fieldFunction = namespace["_{}".format(self.fieldName)]
             except Exception as e:
-                self.fieldFunctionEdit.turnRed()
-                self.fieldFunctionHelperLabel.setText("(Exception: {})".format(e).replace("<string>, ", ""))
-                self.fieldFunctionHelperLabel.setStyleSheet("QLabel {color: rgb(255, 0, 0)}")
-                self.unitEdit.setPlaceholderText("Please set Field function first.")
-        else:
-            self.unitEdit.setPlaceholderText("Please set Field function first.")
+                self.showReadError(self.readCount, e)
+                return
+            readKey = (text, self.fieldName)
+            if readKey in self.functionUnits:
+                self.receiveUnit(self.readCount, readKey,
+                                 self.functionUnits[readKey])
+                return
+            # some of the errors haven't been caught so far, i.e. nameErrors.
+            # The dry run doesn't read data, so it can be done in a worker
+            self.readPending = True
+            self.unitEdit.setPlaceholderText("Checking the field function...")
+            self.validateUnit()
+            startWorker(getDryRunUnits, (self.fieldFunction, self.dryData),
+                        partial(self.receiveUnit, self.readCount, readKey),
+                        partial(self.readOnSampleData, self.readCount,
+                                readKey))
+            return
+        self.readCount += 1
+        self.lastRead = None
+        self.readPending = False
+        self.unitEdit.setPlaceholderText("Please set Field function first.")
+        self.validateUnit()
+
+    def receiveUnit(self, readCount, readKey, unit):
+        """Stores the units of the output of the field function if they
+        belong to the latest read."""
+        if len(self.functionUnits) >= 32:  # Drop the oldest entry
+            self.functionUnits.pop(next(iter(self.functionUnits)))
+        self.functionUnits[readKey] = unit
+        if readCount != self.readCount:
+            return
+        self.readPending = False
+        self.baseUnit = unit
+        self.dim = unit.dimensions
+        self.unitEdit.setPlaceholderText(str(unit))
+        if self.unitEdit.text() == "":
+            self.unitEdit.setText(str(unit))
+        self.unitEdit.setToolTip("Set the default units to {}-dimension".format(self.dim))
+        self.lastRead = readKey
+        self.validateUnit()
+
+    def readOnSampleData(self, readCount, readKey, dryRunError):
+        """Called if the dry run of the field function has failed. The
+        function is then called on the sample data in the main thread since
+        yt isn't thread-safe."""
+        if readCount != self.readCount:
+            return
+        try:
+            unit = getFunctionUnits(self.fieldFunction, self.sp)
+        except Exception as e:
+            self.showReadError(readCount, e)
+            return
+        self.receiveUnit(readCount, readKey, unit)
+
+    def showReadError(self, readCount, e):
+        """Shows the exception raised while reading the field function if it
+        belongs to the latest read."""
+        if readCount != self.readCount:
+            return
+        self.readPending = False
+        self.fieldFunctionEdit.turnRed()
+        self.fieldFunctionHelperLabel.setText("(Exception: {})".format(e).replace("<string>, ", ""))
+        self.unitEdit.setPlaceholderText("Please set Field function first.")
         self.validateUnit()
 
     def setDisplayName(self):
@@ -255,14 +492,11 @@ class AskFieldDialog(QW.QDialog):
         """Enable the apply button if all of the entries by the user are valid,
         else disable it"""
         button = self.buttonBox.buttons()[0]
-        if not isValid:
-            button.setDisabled(True)
-            return
-        for wid in [self.fieldNameEdit, self.fieldFunctionEdit, self.unitEdit]:
-            if not wid.isValid:
-                button.setDisabled(True)
-                return
-        button.setEnabled(True)
+        enable = isValid and all(getattr(wid, "isValid", False) for wid in
+                                 [self.fieldNameEdit, self.fieldFunctionEdit,
+                                  self.unitEdit])
+        if button.isEnabled() != enable:
+            button.setEnabled(enable)
 
     def validateFieldName(self, text):
         """Checks if the given Name for the derived field is already in the
@@ -280,24 +514,31 @@ class AskFieldDialog(QW.QDialog):
             self.fieldNameEdit.turnTextBlack()
             setValidity(self.fieldNameEdit, True)
             self.fieldName = self.fieldNameEdit.text()
+        self.defLine = "def _{}(field, data):".format(self.fieldName)
+
+    def getUnitDimensions(self, text):
+        """Returns the dimensions of the unit given by text, or None if it
+        can't be parsed. The results are cached since parsing is slow."""
+        if text not in self.unitDimensions:
+            try:
+                unit = yt.YTQuantity(self.sp.ds.arr(1, text)).units
+                self.unitDimensions[text] = unit.dimensions
+            except (UnitParseError, AttributeError):
+                self.unitDimensions[text] = None
+        return self.unitDimensions[text]
 
     def validateUnit(self):
         """Checks whether the unit given matches the dimensionality of the out-
         put of the function."""
-        if self.fieldFunctionEdit.isValid:
+        if self.fieldFunctionEdit.isValid and not self.readPending:
             if self.unitEdit.text() == "auto":
                 self.unitEdit.turnTextBlack()
                 setValidity(self.unitEdit, True)
                 return
-            try:
-                unit = yt.YTQuantity(self.sp.ds.arr(1, self.unitEdit.text())).units
-                if unit.dimensions == self.dim:
-                    self.unitEdit.turnTextBlack()
-                    setValidity(self.unitEdit, True)
-                else:
-                    self.unitEdit.turnTextRed()
-                    setValidity(self.unitEdit, False)
-            except (UnitParseError, AttributeError):
+            if self.getUnitDimensions(self.unitEdit.text()) == self.dim:
+                self.unitEdit.turnTextBlack()
+                setValidity(self.unitEdit, True)
+            else:
                 self.unitEdit.turnTextRed()
                 setValidity(self.unitEdit, False)
         else:
@@ -305,6 +546,20 @@ class AskFieldDialog(QW.QDialog):
             setValidity(self.unitEdit, False)
 
 
+RedTextEditStyle = """QTextEdit {border: 2px solid gray;
+                           border-radius: 2px; padding: 1px 1px;
+                           border-color: rgb(255,0,0); background-color:
+                           rgb(255,228,225)}
+                           QTextEdit:focus {border-color: rgb(255,100,100)}
+                           QTextEdit:hover {border-color: rgb(255,100,100)}"""
+BlackTextEditStyle = """QTextEdit {border: 2px solid gray;
+                           border-radius: 2px; padding: 1px 1px}
+                           QTextEdit:focus {border-color: rgb(79,148,205)}
+                           QTextEdit:hover {border-color: rgb(79,148,205)}"""
+RedLabelStyle = "QLabel {color: rgb(255, 0, 0)}"
+BlackLabelStyle = "QLabel {color: rgb(0, 0, 0)}"
+
+
 class derivedFieldTextEdit(QW.QTextEdit):
     """A TextEdit which is used to interpret the text put in for the derived
     fields."""
@@ -312,7 +567,15 @@ class derivedFieldTextEdit(QW.QTextEdit):
     def __init__(self, label, parent=None, *args):
         super().__init__(parent=parent, *args)
         self.infoLabel = label
-        self.formatter = HtmlFormatter(nobackground=True, full=True, cssclass="code")
+        self.setAcceptRichText(False)
+        self.setFont(QG.QFontDatabase.systemFont(QG.QFontDatabase.FixedFont))
+        self.highlighter = pythonHighlighter(self.document())
+        # The text is only validated once the user stops typing for a moment
+        self.validateTimer = QC.QTimer(self)
+        self.validateTimer.setSingleShot(True)
+        self.validateTimer.setInterval(150)
+        self.validateTimer.timeout.connect(self.validateText)
+        self.lastValidated = None  # (text, field name) of the last validation
         text = ('''def _(field, data):
     """The function for the new field. See
     https://yt-project.org/doc/developing/creating_derived_fields.html
@@ -324,37 +587,36 @@ class derivedFieldTextEdit(QW.QTextEdit):
     value = data["pden"] / data["DENSITY"]  # enter possible conversion here
     return value
 ''')
-        text = highlight(text, Python3Lexer(), self.formatter)
-        self.setHtml(text)
+        self.setPlainText(text)
         self.textCursor().setPosition(36)
 
     def focusOutEvent(self, event):
         """We want to check our code each time we are finished"""
+        self.flushValidation()
         self.editingFinished.emit()
         super().focusOutEvent(event)
 
     def turnRed(self):
-        self.setStyleSheet("""QTextEdit {border: 2px solid gray;
-                           border-radius: 2px; padding: 1px 1px;
-                           border-color: rgb(255,0,0); background-color:
-                           rgb(255,228,225)}
-                           QTextEdit:focus {border-color: rgb(255,100,100)}
-                           QTextEdit:hover {border-color: rgb(255,100,100)}""")
-        self.infoLabel.setStyleSheet("QLabel {color: rgb(255, 0, 0)}")
+        self.setStyles(RedTextEditStyle, RedLabelStyle)
         setValidity(self, False)
 
     def turnBlack(self):
-        self.setStyleSheet("""QTextEdit {border: 2px solid gray;
-                           border-radius: 2px; padding: 1px 1px}
-                           QTextEdit:focus {border-color: rgb(79,148,205)}
-                           QTextEdit:hover {border-color: rgb(79,148,205)}""")
-        self.infoLabel.setStyleSheet("QLabel {color: rgb(0, 0, 0)}")
+        self.setStyles(BlackTextEditStyle, BlackLabelStyle)
         setValidity(self, True)
 
+    def setStyles(self, editStyle, labelStyle):
+        """Sets the style sheets of the edit and the info label unless they
+        are already set, since each call restyles the widget."""
+        if self.styleSheet() != editStyle:
+            self.setStyleSheet(editStyle)
+        if self.infoLabel.styleSheet() != labelStyle:
+            self.infoLabel.setStyleSheet(labelStyle)
+
     def keyPressEvent(self, event):
         """We need to reimplement this event to grab the enter key and to
         validate our text"""
         if event.modifiers() ==  QC.Qt.ControlModifier and event.key() == QC.Qt.Key_Return:
+            self.flushValidation()
             self.editingFinished.emit()  # This way, the user can run the function by pressing Ctrl+Enter
             return
         text = self.toPlainText()
@@ -374,43 +636,57 @@ class derivedFieldTextEdit(QW.QTextEdit):
             if event.key() == 16777220:  # this corresponds to enter
                 self.insertPlainText(" "*4)
                 return
-            self.validateText()  # this will unfortunately deselect any text.
+            # this will unfortunately deselect any text.
+            self.validateTimer.start()
+
+    def flushValidation(self):
+        """Validates the text right away if a validation is still pending, so
+        the function isn't read with an outdated validity."""
+        if self.validateTimer.isActive():
+            self.validateTimer.stop()
+            self.validateText()
 
     def validateText(self):
         """Function that validates the text in a way we need it to be"""
         text = self.toPlainText()
-        splitText = text.split("\n")
-        if splitText[0] != "def _{}(field, data):".format(self.parent().fieldName):
-            splitText[0] = "def _{}(field, data):".format(self.parent().fieldName)
-            text = "\n".join(splitText)
+        # Nothing to do if neither the text nor the field name have changed
+        if (text, self.parent().fieldName) == self.lastValidated:
+            return
+        firstLine, newLine, body = text.partition("\n")
+        defLine = self.parent().defLine
+        if firstLine != defLine:
+            text = defLine + newLine + body
         else:
             self.turnBlack()
         try:
             # this will try to execute the function
-            exec(text)
+            exec(compileFieldCode(text), createFieldNamespace())
             self.infoLabel.setText("(No python exception)")
             self.turnBlack()
         except Exception as e:
             self.turnRed()
             self.infoLabel.setText(f"(Exception: {e})".replace("<string>, ", ""))
         self.restoreText(text)
+        self.lastValidated = (self.toPlainText(), self.parent().fieldName)
 
     def restoreText(self, text):
-        """Takes the text and displays it in python style syntax. Unfortunately
-        this is a pretty clunky way of doing it, but it wouldn't work otherwise
+        """Sets the text if it differs from the current one, keeping the
+        position of the cursor. The highlighting is done by the highlighter.
         """
+        if text == self.toPlainText():
+            return
         pos = self.textCursor().position()
-        text = highlight(text, Python3Lexer(), self.formatter)
-        textSplit = text.split("</pre>")
-        textSplit[0] = textSplit[0].strip()
-        text = "</pre>".join(textSplit)
-        self.setHtml(text)
-        for i in range(pos):
-            self.moveCursor(QG.QTextCursor.NextCharacter)
+        self.setPlainText(text)
+        cursor = self.textCursor()
+        # characterCount includes the final paragraph separator
+        cursor.setPosition(min(pos, self.document().characterCount() - 1))
+        self.setTextCursor(cursor)
 
 
 def setValidity(wid, isValid):
     """Sets the validity of the given widget wid and calls its parentmethod."""
+    if getattr(wid, "isValid", None) == isValid:
+        return  # The state of the apply button doesn't change either
     if isValid:
         wid.isValid = True
         wid.parent().validateApply()
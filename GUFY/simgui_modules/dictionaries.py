@@ -19,6 +19,9 @@ Each time a new key is added, it should be added here as well.
 """
 
 
+from itertools import chain
+
+
 def createButton_Dict():
     """Creates a dictionary with all of the keys for the Button widgets.
     The widgets are assigned later using the function "createAllButtons"."""
@@ -32,7 +35,7 @@ def createButton_Dict():
                "XCalc", "YCalc", "ZCalc",  # For calculating extrema
                "XRecalc", "YRecalc", "ZRecalc",  # For opening a dialog to recalculate extrema
                "QuickCart", "QuickCyli", "QuickSeries"] # some test mode buttons
-    Button_Dict = dict(zip(buttons, [""]*len(buttons)))
+    Button_Dict = dict.fromkeys(buttons, "")
     return Button_Dict
 
 
@@ -48,7 +51,7 @@ def createCheckBox_Dict():
              "AddProfile",  # For adding a second profile to a profile plot
              "TimeSeriesProf",  # For toggling multiple profiles for a profile plot in time series mode
              "ParticlePlot"]  # For toggling particle plots
-    CheckBox_Dict = dict(zip(boxes, [""]*len(boxes)))
+    CheckBox_Dict = dict.fromkeys(boxes, "")
     return CheckBox_Dict
 
 
@@ -59,7 +62,7 @@ def createComboBox_Dict():
              "NAxis",  # For the axis-aligned normal axis
              "YWeight", "ZWeight",  # For the weight fields
              "TimeQuantity"]  # For the quantity to be calculated for profile plots with respect to time
-    ComboBox_Dict = dict(zip(boxes, [""]*len(boxes)))
+    ComboBox_Dict = dict.fromkeys(boxes, "")
     return ComboBox_Dict
 
 
@@ -79,7 +82,7 @@ def createEdit_Dict():
              "XNormNorth", "YNormNorth", "ZNormNorth",  # For north vector input (slice and proj)
              "PlotTitle",  # For the plot title
              "ColorScheme"]  # For the color scheme
-    Edit_Dict = dict(zip(edits, [""]*len(edits)))
+    Edit_Dict = dict.fromkeys(edits, "")
     return Edit_Dict
 
 
@@ -93,7 +96,7 @@ def createLabel_Dict():
               "CurrentDataSet", "DataSetTime",  # For information about the current dataset
               "Geometry", "Dimensions",  # For information about the current dataset
               "LineLength"]  # For the line length of a line plot line
-    Label_Dict = dict(zip(labels, [""]*len(labels)))
+    Label_Dict = dict.fromkeys(labels, "")
     return Label_Dict
 
 
@@ -104,7 +107,7 @@ def createMisc_Dict():
     miscs = ["SeriesSlider",  # Slider for choosing a file in time series mode
              "ProfileSpinner", # Spinner for choosing how many files are skipped for multiple profiles
              "LogBox"]  # TextBox for displaying logger information
-    Misc_Dict = dict(zip(miscs, [""]*len(miscs)))
+    Misc_Dict = dict.fromkeys(miscs, "")
     return Misc_Dict
 
 
@@ -182,17 +185,21 @@ def createParam_Dict():
     curr, currDef = ["CurrentDataSet", "CurrentPlotWindow"], ["", ""]
     # keys not fitting into any category: Toggling particle plots, the type of
     # a valid plot, the Signal Handler, the dictionary for keeping track of
-    # the derived fields, and a mode for testing:
+    # the derived fields, a mode for testing, the function to clear the
+    # cache of loaded datasets and a flag that is set while loading:
     misc = ["ParticlePlot", "isValidPlot", "SignalHandler", "NewDerFieldDict",
-            "OnlyEvery", "TestingMode"]
-    miscDef = [False, "(PlotType)", "(QObject)", {}, 1, False]
-    keys = (field + possField + extrema + extrStore + log + domain + norm +
-            quan + point + prof + anno + modes + file + single + series +
-            curr + misc)
-    values = (fieldDef + possFieldDef + extremaDef + extrStoreDef + logDef +
-              domainDef + normDef + quanDef + pointDef + profDef + annoDef +
-              modesDef + fileDef + singleDef + seriesDef + currDef + miscDef)
-    Param_Dict = dict(zip(keys, values))
+            "OnlyEvery", "TestingMode", "ClearDSCache", "LoadingInFlight"]
+    miscDef = [False, "(PlotType)", "(QObject)", {}, 1, False, "(function)",
+               False]
+    # The pairs are chained so the key and value lists aren't concatenated
+    Param_Dict = dict(chain(
+        zip(field, fieldDef), zip(possField, possFieldDef),
+        zip(extrema, extremaDef), zip(extrStore, extrStoreDef),
+        zip(log, logDef), zip(domain, domainDef), zip(norm, normDef),
+        zip(quan, quanDef), zip(point, pointDef), zip(prof, profDef),
+        zip(anno, annoDef), zip(modes, modesDef), zip(file, fileDef),
+        zip(single, singleDef), zip(series, seriesDef), zip(curr, currDef),
+        zip(misc, miscDef)))
     return Param_Dict
 
 
@@ -205,7 +212,7 @@ def createRadioDict_Dict():
              "DimMode",  # For dimensions (1D/2D)
              "1DOptions",  # For 1D-plots (profile/line)
              "2DOptions"]  # For 2D-plots (phase/slice/projection)
-    RadioDict_Dict = dict(zip(dicts, [""]*len(dicts)))
+    RadioDict_Dict = dict.fromkeys(dicts, "")
     return RadioDict_Dict
 
 
@@ -216,7 +223,7 @@ def createStatus_Dict():
     wids = ["Bar",  # The status bar itself, host of the labels
             "Status",  # For current status information
             "Dir", "File", "Series"]  # For permanent file/series information
-    Status_Dict = dict(zip(wids, [""]*len(wids)))
+    Status_Dict = dict.fromkeys(wids, "")
     return Status_Dict
 
 
@@ -236,5 +243,5 @@ def createWid_Dict():
             "DataSeriesLabels",  # Layout for file information labels
             "TopLayout",  # Layout for the file options and the plot window
             "ParticlePlot"]  # Layout for the particle plot CheckBox
-    Wid_Dict = dict(zip(wids, [""]*len(wids)))
+    Wid_Dict = dict.fromkeys(wids, "")
     return Wid_Dict
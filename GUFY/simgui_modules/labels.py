@@ -17,6 +17,13 @@ Module containing all commands used for the creation of the labels
 import PyQt5.QtWidgets as QW
 
 
+# Style sheet for all styled coolLabels. The second selector makes sure it
+# isn't overridden by the style of the horizontal layouts they may be in.
+LabelStyle = """QLabel#coolLabel, QWidget#horLayout QLabel#coolLabel {
+    border: 0px solid gray; border-radius: 0px; padding: 1px 1px;
+    color: rgb(0,0,0); height: 18px}"""
+
+
 class coolLabel(QW.QLabel):
     """Modified version of QLabels.
     Creates a QLabel with a given text and tooltip.
@@ -26,15 +33,29 @@ class coolLabel(QW.QLabel):
     """
     def __init__(self, text="", tooltip="", width=False, style=True):
         super().__init__()
-        self.setText(text)
-        self.setToolTip(tooltip)
+        # Only call the setters that change anything
+        if text:
+            self.setText(text)
+        if tooltip:
+            self.setToolTip(tooltip)
         if width:
             self.setMinimumWidth(50)
             self.setMaximumWidth(100)
-        if style:
-            self.setStyleSheet("""QLabel {border: 0px solid gray;
-                               border-radius: 0px; padding: 1px 1px;
-                               color: rgb(0,0,0); height: 18px}""")
+        if style:  # The style sheet is set on the application
+            self.setObjectName("coolLabel")
+
+
+# (key, text, tooltip, width, style) of all Labels of the main window
+LabelSpecs = (
+    tuple((key, "", "", True, True) for key in
+          ["XMinUnit", "YMinUnit", "ZMinUnit", "XMaxUnit", "YMaxUnit",
+           "ZMaxUnit", "XCenUnit", "YCenUnit", "ZCenUnit", "HorWidthUnit",
+           "VerWidthUnit"]) +
+    tuple((key, "", "", False, True) for key in
+          ["CurrentDataSet", "DataSetTime", "Geometry", "Dimensions"]) +
+    (("LineLength", "", "Displays the length of the line", False, False),) +
+    tuple((axis + "Center", f"Center {axis.lower()}:", "", False, False)
+          for axis in ["X", "Y", "Z"]))
 
 
 def createAllLabels(Label_Dict):
@@ -42,17 +63,5 @@ def createAllLabels(Label_Dict):
     params:
         Label_Dict: Dict to contain all the QLabels
     """
-    labelKeys = ["XMinUnit", "YMinUnit", "ZMinUnit", "XMaxUnit", "YMaxUnit",
-                 "ZMaxUnit",
-                 "XCenUnit", "YCenUnit", "ZCenUnit", "HorWidthUnit",
-                 "VerWidthUnit"]
-    for key in labelKeys:
-        Label_Dict[key] = coolLabel("", width=True)
-    labelKeys = ["CurrentDataSet", "DataSetTime", "Geometry", "Dimensions"]
-    for key in labelKeys:
-        Label_Dict[key] = coolLabel("", width=False)
-    Label_Dict["LineLength"] = coolLabel("", "Displays the length of the line",
-                                         style=False)
-    for axis in ["X", "Y", "Z"]:
-        Label_Dict[axis + "Center"] = coolLabel(text=f"Center {axis.lower()}:",
-                                                width=False, style=False)
+    for key, text, tooltip, width, style in LabelSpecs:
+        Label_Dict[key] = coolLabel(text, tooltip, width, style)
@@ -18,6 +18,7 @@ Sorted in alphabetical order.
 import PyQt5.QtGui as QG
 import PyQt5.QtCore as QC
 import PyQt5.QtWidgets as QW
+from simgui_modules.utils import pausedUpdates
 
 
 def createAllWidgets(Window):
@@ -28,48 +29,46 @@ def createAllWidgets(Window):
         Window.ComboBox_Dict, Window.RadioDict_Dict,
         Window.Edit_Dict, Window.Button_Dict, Window.CheckBox_Dict,
         Window.Label_Dict, Window.Param_Dict, Window.Misc_Dict)
-    # Create the radio button layouts
-    Wid_Dict["EvalMode"] = RBWidget(RadioDict_Dict["EvalMode"], "Evaluation mode")
-    Wid_Dict["1DOptions"] = RBWidget(RadioDict_Dict["1DOptions"], "1D plot options", Button_Dict)
-    Wid_Dict["2DOptions"] = RBWidget(RadioDict_Dict["2DOptions"], "2D plot options", Button_Dict)
-    Wid_Dict["DimMode"] = RBWidget(RadioDict_Dict["DimMode"], "Plot dimension")
-    Wid_Dict["NormVecMode"] = RBWidget(RadioDict_Dict["NormVecMode"], "Normal vector")
-    Wid_Dict["DataSeriesLabels"] = createHorLayout([QW.QLabel("Selected Dataset: "),
-                                                   Label_Dict["CurrentDataSet"],
-                                                   Label_Dict["DataSetTime"],
-                                                   Label_Dict["Dimensions"],
-                                                   Label_Dict["Geometry"]])
-    Wid_Dict["NormInput"] = createHorLayout([Edit_Dict["XNormDir"],
-                                            Edit_Dict["YNormDir"],
-                                            Edit_Dict["ZNormDir"]],
-                                            spacing=3)
-    Wid_Dict["NorthInput"] = createHorLayout([Edit_Dict["XNormNorth"],
-                                             Edit_Dict["YNormNorth"],
-                                             Edit_Dict["ZNormNorth"]],
-                                             spacing=3)
-    # Create the puzzle pieces the layout is made of:
-    Wid_Dict["FileOptions"] = fileOptions(Wid_Dict["EvalMode"], Button_Dict,
-                                          Param_Dict, Misc_Dict, Wid_Dict)
-    Wid_Dict["XAxis"] = axisOptions("X", ComboBox_Dict, Edit_Dict,
-                                    CheckBox_Dict, Button_Dict,
-                                    Label_Dict, ComboBox_Dict)
-    Wid_Dict["YAxis"] = axisOptions("Y", ComboBox_Dict, Edit_Dict,
-                                    CheckBox_Dict, Button_Dict,
-                                    Label_Dict, ComboBox_Dict)
-    Wid_Dict["ZAxis"] = axisOptions("Z", ComboBox_Dict, Edit_Dict,
-                                    CheckBox_Dict, Button_Dict,
-                                    Label_Dict, ComboBox_Dict)
-    Wid_Dict["NAxis"] = normalAxisOptions(Wid_Dict, ComboBox_Dict, Edit_Dict,
-                                          Label_Dict)
-    Wid_Dict["LineOptions"] = lineOptions(Edit_Dict, Label_Dict)
-    Wid_Dict["SlcProjOptions"] = slcProjOptions(Edit_Dict, Button_Dict,
-                                                Label_Dict, CheckBox_Dict)
-    Wid_Dict["ProfileOptions"] = profileOptions(CheckBox_Dict, ComboBox_Dict,
-                                                Misc_Dict)
-    Wid_Dict["AnnotationOptions"] = annotationOptions(CheckBox_Dict, Edit_Dict)
-    Wid_Dict["ParticlePlot"] = particleOptions(CheckBox_Dict)
-    Wid_Dict["PlotOptions"] = plotOptions(Wid_Dict, Button_Dict)
-    Wid_Dict["TopLayout"] = createMainLayout(Wid_Dict, Window._main)
+    # The widgets are only painted once everything has been placed
+    with pausedUpdates(Window._main):
+        # Create the radio button layouts
+        Wid_Dict["EvalMode"] = RBWidget(RadioDict_Dict["EvalMode"], "Evaluation mode")
+        Wid_Dict["1DOptions"] = RBWidget(RadioDict_Dict["1DOptions"], "1D plot options", Button_Dict)
+        Wid_Dict["2DOptions"] = RBWidget(RadioDict_Dict["2DOptions"], "2D plot options", Button_Dict)
+        Wid_Dict["DimMode"] = RBWidget(RadioDict_Dict["DimMode"], "Plot dimension")
+        Wid_Dict["NormVecMode"] = RBWidget(RadioDict_Dict["NormVecMode"], "Normal vector")
+        Wid_Dict["DataSeriesLabels"] = createHorLayout([QW.QLabel("Selected Dataset: "),
+                                                       Label_Dict["CurrentDataSet"],
+                                                       Label_Dict["DataSetTime"],
+                                                       Label_Dict["Dimensions"],
+                                                       Label_Dict["Geometry"]])
+        Wid_Dict["NormInput"] = createHorLayout([Edit_Dict["XNormDir"],
+                                                Edit_Dict["YNormDir"],
+                                                Edit_Dict["ZNormDir"]],
+                                                spacing=3)
+        Wid_Dict["NorthInput"] = createHorLayout([Edit_Dict["XNormNorth"],
+                                                 Edit_Dict["YNormNorth"],
+                                                 Edit_Dict["ZNormNorth"]],
+                                                 spacing=3)
+        # Create the puzzle pieces the layout is made of:
+        Wid_Dict["FileOptions"] = fileOptions(Wid_Dict["EvalMode"], Button_Dict,
+                                              Param_Dict, Misc_Dict, Wid_Dict)
+        for axis in ["X", "Y", "Z"]:
+            Wid_Dict[axis + "Axis"] = axisOptions(axis, ComboBox_Dict,
+                                                  Edit_Dict, CheckBox_Dict,
+                                                  Button_Dict, Label_Dict,
+                                                  ComboBox_Dict)
+        Wid_Dict["NAxis"] = normalAxisOptions(Wid_Dict, ComboBox_Dict, Edit_Dict,
+                                              Label_Dict)
+        Wid_Dict["LineOptions"] = lineOptions(Edit_Dict, Label_Dict)
+        Wid_Dict["SlcProjOptions"] = slcProjOptions(Edit_Dict, Button_Dict,
+                                                    Label_Dict, CheckBox_Dict)
+        Wid_Dict["ProfileOptions"] = profileOptions(CheckBox_Dict, ComboBox_Dict,
+                                                    Misc_Dict)
+        Wid_Dict["AnnotationOptions"] = annotationOptions(CheckBox_Dict, Edit_Dict)
+        Wid_Dict["ParticlePlot"] = particleOptions(CheckBox_Dict)
+        Wid_Dict["PlotOptions"] = plotOptions(Wid_Dict, Button_Dict)
+        Wid_Dict["TopLayout"] = createMainLayout(Wid_Dict, Window._main)
 
 
 def createMainLayout(Wid_Dict, _main):
@@ -93,6 +92,12 @@ def createMainLayout(Wid_Dict, _main):
     return topLayout  # Store it in Wid_Dict for later use
 
 
+# Keys of the annotation CheckBoxes in the order they are displayed in
+AnnotationBoxKeys = tuple(sorted(["Timestamp", "Scale", "Grid", "Contour",
+                                  "VelVectors", "VelStreamlines", "MagVectors",
+                                  "MagStreamlines", "LineAnno"]))
+
+
 def annotationOptions(CheckBox_Dict, Edit_Dict):
     """Creates the GroupBox for the annotation options
     params:
@@ -105,25 +110,25 @@ def annotationOptions(CheckBox_Dict, Edit_Dict):
     scroll = QW.QScrollArea(wid)
     box.addWidget(scroll)
     scroll.setWidgetResizable(True)
-    scrollContent = QW.QGroupBox(scroll)
-    scrollLayout = QW.QVBoxLayout()
+    # A plain widget is enough to hold the boxes, a frame isn't needed
+    scrollContent = QW.QWidget(scroll)
+    scrollLayout = QW.QVBoxLayout(scrollContent)
     scrollLayout.setContentsMargins(0, 0, 0, 0)
-    scrollContent.setLayout(scrollLayout)
     scrollLayout.setSpacing(3)
-    keys = ["Timestamp", "Scale", "Grid", "Contour",
-            "VelVectors", "VelStreamlines",
-            "MagVectors", "MagStreamlines", "LineAnno"]
     scrollLayout.addWidget(Edit_Dict["PlotTitle"])
-    for key in sorted(keys):
+    for key in AnnotationBoxKeys:
         scrollLayout.addWidget(CheckBox_Dict[key])
     scrollLayout.insertWidget(6, createHorLayout([CheckBox_Dict["ParticleAnno"],
                               Edit_Dict["PSlabWidth"]]))
     scrollLayout.addStretch(1)
     scroll.setWidget(scrollContent)
-    scrollContent.setStyleSheet("QGroupBox {border: transparent}")
     return wid
 
 
+# Titles of the group boxes of the axis options
+AxisTitles = {"X": "Horizontal", "Y": "Vertical", "Z": "Colorbar"}
+
+
 def axisOptions(axis, Box_Dict, Edit_Dict, CheckBox_Dict, Button_Dict,
                 Label_Dict, ComboBox_Dict):
     """Creates the AxisOptions Layout and returns it as a widget.
@@ -135,35 +140,34 @@ def axisOptions(axis, Box_Dict, Edit_Dict, CheckBox_Dict, Button_Dict,
     returns:
         wid: GroupBox in FormLayout that hosts the relevant stuff.
     """
-    if axis == "X":
-        text = "Horizontal"
-    elif axis == "Y":
-        text = "Vertical"
-    elif axis == "Z":
-        text = "Colorbar"
-    wid = QW.QGroupBox(text)
+    wid = QW.QGroupBox(AxisTitles[axis])
     layout = QW.QFormLayout(wid)
     layout.setVerticalSpacing(3)
-    layout.addRow(QW.QLabel("Field:"), Box_Dict[axis + "Axis"])
+    layout.addRow("Field:", Box_Dict[axis + "Axis"])
     if axis == "Y":
-        layout.addRow(QW.QLabel("Quantity:"), ComboBox_Dict["TimeQuantity"])
-    layout.addRow(QW.QLabel("Min:"), createHorLayout([Edit_Dict[axis +"Min"], Label_Dict[axis + "MinUnit"]]))
-    layout.addRow(QW.QLabel("Max:"), createHorLayout([Edit_Dict[axis +"Max"], Label_Dict[axis + "MaxUnit"]]))
-    layout.addRow(QW.QLabel("Unit:"), Edit_Dict[axis +"Unit"])
-    layout.addRow(QW.QLabel("Log Scaling:"), CheckBox_Dict[axis +"Log"])
+        layout.addRow("Quantity:", ComboBox_Dict["TimeQuantity"])
+    layout.addRow("Min:", createHorLayout([Edit_Dict[axis +"Min"], Label_Dict[axis + "MinUnit"]]))
+    layout.addRow("Max:", createHorLayout([Edit_Dict[axis +"Max"], Label_Dict[axis + "MaxUnit"]]))
+    layout.addRow("Unit:", Edit_Dict[axis +"Unit"])
+    layout.addRow("Log Scaling:", CheckBox_Dict[axis +"Log"])
     if axis == "Z":
-        layout.addRow(QW.QLabel("Weight field:"), ComboBox_Dict["ZWeight"])
-        layout.addRow(QW.QLabel("Colors:"), Edit_Dict["ColorScheme"])
-        layout.addRow(QW.QLabel("Norm:"), CheckBox_Dict["DomainDiv"])
+        layout.addRow("Weight field:", ComboBox_Dict["ZWeight"])
+        layout.addRow("Colors:", Edit_Dict["ColorScheme"])
+        layout.addRow("Norm:", CheckBox_Dict["DomainDiv"])
     layout.addWidget(createHorLayout([Button_Dict[axis + "Calc"], Button_Dict[axis + "Recalc"]]))
     return wid
 
 
+# Style sheet for the widgets created by createHorLayout and everything in
+# them. It is set on the application so it is only parsed once.
+HorLayoutStyle = """QWidget#horLayout, QWidget#horLayout QWidget {
+    border: 0px solid gray; border-radius: 0px; padding: 0, 0, 0, 0}"""
+
+
 def createHorLayout(widList, stretch=True, spacing=0):
     """Create horizontal box layout widget containing widgets in widList"""
     wid = QW.QWidget()
-    wid.setStyleSheet("""QWidget {border: 0px solid gray;
-                           border-radius: 0px; padding: 0, 0, 0, 0}""")
+    wid.setObjectName("horLayout")  # For HorLayoutStyle
     layout = QW.QHBoxLayout(wid)
     layout.setContentsMargins(0, 0, 0, 0)
     layout.setSpacing(spacing)
@@ -209,8 +213,10 @@ def hideShowLabels(FormLayout, start, end, hide=True):
         FormLayout: The layout to perform hide/show on
         start, end: starting and ending point of hiding/showing
         hide: bool. True for hiding, False for showing."""
-    for i in range(start, end+1):
-        FormLayout.layout().itemAt(i).widget().setHidden(hide)
+    layout = FormLayout.layout()  # FormLayout may also be the widget
+    with pausedUpdates(layout.parentWidget()):
+        for i in range(start, end+1):
+            layout.itemAt(i).widget().setHidden(hide)
 
 
 def lineOptions(Edit_Dict, Label_Dict):
@@ -360,13 +366,13 @@ def slcProjOptions(Edit_Dict, Button_Dict, Label_Dict, CheckBox_Dict):
     wid = QW.QGroupBox("Slice plot options")
     layout = QW.QFormLayout(wid)
     layout.setSpacing(3)
-    layout.addRow(QW.QLabel("Grid Unit:"), Edit_Dict["GridUnit"])
+    layout.addRow("Grid Unit:", Edit_Dict["GridUnit"])
     layout.addRow(Label_Dict["XCenter"], createHorLayout([Edit_Dict["XCenter"], Label_Dict["XCenUnit"]]))
     layout.addRow(Label_Dict["YCenter"], createHorLayout([Edit_Dict["YCenter"], Label_Dict["YCenUnit"]]))
     layout.addRow(Label_Dict["ZCenter"], createHorLayout([Edit_Dict["ZCenter"], Label_Dict["ZCenUnit"]]))
-    layout.addRow(QW.QLabel("Hor. width: "), createHorLayout([Edit_Dict["HorWidth"], Label_Dict["HorWidthUnit"]]))
-    layout.addRow(QW.QLabel("Vert. width: "), createHorLayout([Edit_Dict["VerWidth"], Label_Dict["VerWidthUnit"]]))
-    layout.addRow(QW.QLabel("Zoom:"), Edit_Dict["Zoom"])
+    layout.addRow("Hor. width: ", createHorLayout([Edit_Dict["HorWidth"], Label_Dict["HorWidthUnit"]]))
+    layout.addRow("Vert. width: ", createHorLayout([Edit_Dict["VerWidth"], Label_Dict["VerWidthUnit"]]))
+    layout.addRow("Zoom:", Edit_Dict["Zoom"])
     layout.addWidget(Button_Dict["MakeLinePlot"])
     layout.addWidget(CheckBox_Dict["SetAspect"])
     return wid
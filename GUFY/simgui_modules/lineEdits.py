@@ -21,10 +21,14 @@ import PyQt5.QtWidgets as QW
 try:
     # Read all of the available cmaps out of a prepared txt file
     with open("simgui_registry/colormaps.txt", 'r') as cmaps:
-        validColors = cmaps.read().split(", ")
+        validColorList = cmaps.read().split(", ")
 except FileNotFoundError:
-    validColors = ["viridis", "plasma", "inferno", "magma", "bwr", "BrBG"]
+    validColorList = ["viridis", "plasma", "inferno", "magma", "bwr", "BrBG"]
     print("colormaps.txt couln't be found")
+# The list keeps the order for the completer, the set is for quick lookups
+validColors = frozenset(validColorList)
+# Style sheets of the coolEdits for each (textColor, backColor)
+EditStyles = {}
 
 
 class coolEdit(QW.QLineEdit):
@@ -63,12 +67,17 @@ class coolEdit(QW.QLineEdit):
     def setColors(self, textColor, backColor):
         """Sets the text- and background color the line edit to given rgb
         triplets"""
-        self.setStyleSheet(f"""QLineEdit {{border: 2px solid gray;
+        key = (textColor, backColor)
+        if key not in EditStyles:
+            EditStyles[key] = f"""QLineEdit {{border: 2px solid gray;
                            border-radius: 2px; padding: 1px 1px;
                            color: rgb({textColor}); background-color:
                            rgb({backColor}); height: 18px}}
                            QLineEdit:focus {{border-color: rgb(79,148,205)}}
-                           QLineEdit:hover {{border-color: rgb(79,148,205)}}""")
+                           QLineEdit:hover {{border-color: rgb(79,148,205)}}"""
+        # Setting the same style sheet again would still restyle the edit
+        if self.styleSheet() != EditStyles[key]:
+            self.setStyleSheet(EditStyles[key])
         
 
 
@@ -213,7 +222,7 @@ def createColorSchemeEdit(width=150):
     text = "viridis"
     lineEdit = coolEdit(lineText=text, placeholder=text,
                         tooltip=tooltip, width=width)
-    completer = QW.QCompleter(validColors)
+    completer = QW.QCompleter(validColorList)
     completer.setCaseSensitivity(True)
     lineEdit.setCompleter(completer)
     return lineEdit
@@ -323,7 +323,7 @@ def createMultipleProfiles(Param_Dict, worker):
     ts = Param_Dict["DataSeries"]
     length = ceil(len(ts)/onlyEvery)
     if Param_Dict["YAxis"] in Param_Dict["NewDerFieldDict"].keys():
-        for ds in ts:
+        for ds in ts.iterPeek():
             if i % onlyEvery == 0:
                 # Create a data container to hold the whole dataset.
                 ad = ds.all_data()
@@ -385,13 +385,13 @@ def createProfWithTimeForX(Param_Dict, worker):
     times = []
     datasets = []
     emitStatus(worker, "Gathering time data")
-    for ds in ts:
+    for name in ts.names:
         # use the times we have already calculated for each dataset
-        time = Param_Dict["DataSetDict"][str(ds) + "Time"].to_value(Param_Dict["XUnit"])
+        time = Param_Dict["DataSetDict"][name + "Time"].to_value(Param_Dict["XUnit"])
         timecompare = float("{:.3g}".format(time))
         if timeMin <= timecompare <= timeMax:
             times.append(time)
-            datasets.append(str(ds))
+            datasets.append(name)
     GUILogger.log(29, "Iterating over the whole series from {:.3g} to {:.3g} {}..."
           .format(timeMin, timeMax, Param_Dict["XUnit"]))
     calcQuan = getCalcQuanName(Param_Dict)
@@ -401,16 +401,17 @@ def createProfWithTimeForX(Param_Dict, worker):
     i = 0
     length = len(times)
     if Param_Dict["YAxis"] in Param_Dict["NewDerFieldDict"].keys():
-        for ds in ts:
-            if str(ds) in datasets:
+        for index, name in enumerate(ts.names):
+            if name in datasets:
                 try:
-                    yResult = Param_Dict["DataSetDict"][str(ds) + field + calcQuan]
+                    yResult = Param_Dict["DataSetDict"][name + field + calcQuan]
                 except KeyError:
-                    ad = ds.all_data()
+                    # The dataset is only loaded if it's really needed
+                    ad = ts.peek(index).all_data()
                     yResult = eval(calcQuanString)
                     # save the plotpoints for later use
                     value = yt.YTQuantity(yResult, Param_Dict["YUnit"]).to_value(Param_Dict["FieldUnits"][field])
-                    Param_Dict["DataSetDict"][str(ds) + field + calcQuan] = value
+                    Param_Dict["DataSetDict"][name + field + calcQuan] = value
                 storage[str(i)] = yResult  # this is kind of clunky, but this way we don't run into problems later
                 i += 1
                 progString = f"{i}/{length} data points calculated"
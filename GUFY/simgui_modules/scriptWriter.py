@@ -702,10 +702,10 @@ y_arr = yt.YTArray(list(storage.values()), "{Param_Dict["YUnit"]}")
         # If possible, pass the values that have already been calculated to the user
         times, values = [], []
         field = Param_Dict["YAxis"]
-        for ds in Param_Dict["DataSeries"]:
+        for name in Param_Dict["DataSeries"].names:
             try:
-                time = Param_Dict["DataSetDict"][str(ds) + "Time"].to_value(Param_Dict["XUnit"])
-                value = Param_Dict["DataSetDict"][str(ds) + field + calcQuanName]
+                time = Param_Dict["DataSetDict"][name + "Time"].to_value(Param_Dict["XUnit"])
+                value = Param_Dict["DataSetDict"][name + field + calcQuanName]
                 value = yt.YTQuantity(value, Param_Dict["FieldUnits"][field]).to_value(Param_Dict["YUnit"])
                 times.append(time)
                 values.append(value)
@@ -24,7 +24,8 @@ from simgui_modules import layouts as slay
 from tokenize import TokenError
 from copy import copy
 from simgui_modules.utils import updateNormalAxis, updateComboBoxes, \
-    convertToLessThanThree, findIndex, calcExtrema, WorkingException
+    convertToLessThanThree, findIndex, calcExtrema, WorkingException, \
+    cacheExtrema
 from simgui_modules.logging import GUILogger
 from simgui_modules.plotWindow import PlotWindow
 from simgui_modules.configureGUI import config
@@ -82,10 +83,11 @@ class SignalHandler(object):
                        "Min", axis)
 
 # %% Mainly ComboBox methods:
-    def getAxisInput(self, axis):
+    def getAxisInput(self, axis, index=None):
         """Reads out current selection of x, y and z axis and stores them.
         For X, Y and Z axis also update the text edits with units and extrema.
         Parameters: axis: "X", "Y", "Z", "N"
+                    index: passed by currentIndexChanged, not needed
         """
         if axis != "N":
             self.getUnitInput(axis, True)
@@ -100,8 +102,9 @@ class SignalHandler(object):
             self.getExtremaInput(axis, "Min")
             self.getExtremaInput(axis, "Max")
 
-    def getWeightField(self, axis):
-        """Reads out currently selected Weight field and stores it"""
+    def getWeightField(self, axis, index=None):
+        """Reads out currently selected Weight field and stores it.
+        index is passed by currentIndexChanged and not needed."""
         getWeightField(self.Param_Dict, self.ComboBox_Dict, self.CheckBox_Dict,
                        axis)
         self.getUnitInput(axis, True)
@@ -187,8 +190,10 @@ class SignalHandler(object):
         getWidthInput(self.Param_Dict, self.Edit_Dict, orientation)
 
 # %% Mainly CheckBox Methods
-    def getAnnotationInput(self, key):
-        """Read out any mundane checkbox-input and store it in Param_Dict."""
+    def getAnnotationInput(self, key, state=None):
+        """Read out any mundane checkbox-input and store it in Param_Dict.
+        state is passed by the toggled signal, the value is taken from the
+        CheckBox itself."""
         getAnnotationInput(self.Param_Dict, self.CheckBox_Dict, key)
 
     def getDomainDivInput(self):
@@ -288,10 +293,10 @@ class SignalHandler(object):
     def getProfOfEveryInput(self):
         getProfOfEveryInput(self.Param_Dict, self.Misc_Dict)
 
-    def getSliderInput(self, value=None, seriesEval=False):
+    def getSliderInput(self, value=None, seriesEval=False, ds=None):
         """Checks the current Slider Input and changes the current File"""
         getSliderInput(self.Param_Dict, self.Label_Dict, self.Misc_Dict,
-                       value=value, seriesEval=seriesEval)
+                       value=value, seriesEval=seriesEval, ds=ds)
         if self.Param_Dict["PlotMode"] == "Profile":
             self.changeToProfile()
 
@@ -349,7 +354,7 @@ def calcMinMax(Param_Dict, Edit_Dict, Button_Dict, Status_Dict, ComboBox_Dict,
         return
     if series:
         globMin, globMax = Min, Max
-        for ds in Param_Dict["DataSeries"]:
+        for ds in Param_Dict["DataSeries"].iterPeek():
                 Min, Max = calcExtrema(Param_Dict, ds, field, projectionCondition)
                 globMin, globMax = min(Min, globMin), max(Max, globMax)
         Min, Max = globMin, globMax
@@ -360,6 +365,7 @@ def calcMinMax(Param_Dict, Edit_Dict, Button_Dict, Status_Dict, ComboBox_Dict,
     # dimensionality problems)
     Param_Dict["FieldMins"][field] = Min.to_value(Param_Dict["FieldUnits"][field])
     Param_Dict["FieldMaxs"][field] = Max.to_value(Param_Dict["FieldUnits"][field])
+    cacheExtrema(Param_Dict)
     if Param_Dict["PlotMode"] == "Projection" and Param_Dict["DomainDiv"]:
         height = Param_Dict["FieldMaxs"]["DomainHeight"] - Param_Dict["FieldMins"]["DomainHeight"]
         Min, Max = Min/height, Max/height
@@ -1416,21 +1422,19 @@ def updateLabels(Param_Dict, Label_Dict):
 
 
 def fillDataSetDict(Param_Dict, Status_Dict, TopLayout, _main):
-    """Scans the current DataSeries object for the times of the datasets,
-    stores them in the DataSetDict and also creates PlotWindows"""
-    length = len(Param_Dict["DataSeries"])
-    for i, ds in enumerate(Param_Dict["DataSeries"]):
-        time = ds.current_time
-        Param_Dict["DataSetDict"][str(ds) + "Time"] = time.convert_to_units("kyr")
+    """Stores the times of the datasets of the current DataSeries object in
+    the DataSetDict and also creates PlotWindows. The times have usually
+    been read while loading the series."""
+    series = Param_Dict["DataSeries"]
+    for i, name in enumerate(series.names):
+        Param_Dict["DataSetDict"][name + "Time"] = series.getTime(i)
         # Initialize a plot window for each dataset so we can have individual plots
         Window = PlotWindow(Status_Dict, parent=_main)
         Window.hide()
         TopLayout.addWidget(Window, 0, 0)
-        Param_Dict["DataSetDict"][str(ds) + "PlotWindow"] = Window
-        if i % ceil(length/4) == 0:  # This way, at max 4 updates are printed
-            GUILogger.info(f"Loading dataset {i+1}/{length}...")
-    Param_Dict["FieldMins"]["time"] = Param_Dict["DataSetDict"][str(Param_Dict["DataSeries"][0]) + "Time"]
-    Param_Dict["FieldMaxs"]["time"] = Param_Dict["DataSetDict"][str(Param_Dict["DataSeries"][-1]) + "Time"]
+        Param_Dict["DataSetDict"][name + "PlotWindow"] = Window
+    Param_Dict["FieldMins"]["time"] = Param_Dict["DataSetDict"][series.names[0] + "Time"]
+    Param_Dict["FieldMaxs"]["time"] = Param_Dict["DataSetDict"][series.names[-1] + "Time"]
 
 
 def getProfOfEveryInput(Param_Dict, Misc_Dict):
@@ -1439,14 +1443,16 @@ def getProfOfEveryInput(Param_Dict, Misc_Dict):
 
 
 def getSliderInput(Param_Dict, Label_Dict, Misc_Dict, value=None,
-                   seriesEval=False):
+                   seriesEval=False, ds=None):
     """Reads out the current slider value, sets the dataset and the status
     information (name and time) on screen.
     Parameters:
-        Param_Dict: For DataSeries, DataSet and DataSetDict"""
+        Param_Dict: For DataSeries, DataSet and DataSetDict
+        ds: The dataset at value if it has already been loaded"""
     if value is None:
         value = Misc_Dict["SeriesSlider"].value()
-    ds = Param_Dict["DataSeries"][value]
+    if ds is None:
+        ds = Param_Dict["DataSeries"][value]
     Param_Dict["CurrentPlotWindow"].hide()
     Param_Dict["CurrentPlotWindow"] = Param_Dict["DataSetDict"][str(ds) + "PlotWindow"]
     Param_Dict["CurrentPlotWindow"].show()
@@ -16,11 +16,13 @@ evaluation functions.
 The module is structured as follows:
     - The ProgressDialog class for creating a progress window when plotting
     - The Worker classes for carrying out the plotting process
+    - The Worker class for loading files and series
     - Function for evaluating single file data
     - Function for evaluating time series data
 """
 import numpy as np
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 import PyQt5.QtWidgets as QW
 import PyQt5.QtCore as QC
 import PyQt5.QtGui as QG
@@ -226,6 +228,90 @@ class TestPlotWorker(WorkerBase):
         self.finished.emit()
 
 
+# %% The Worker class for loading files and series
+class LoadSignals(QC.QObject):
+    """QRunnables can't emit signals themselves, so they are stored here"""
+    finished = QC.pyqtSignal(object)  # emits the loaded object
+    failed = QC.pyqtSignal(object)  # emits the exception that occured
+
+
+class LoadWorker(QC.QRunnable):
+    """A worker that is run in the global thread pool so the GUI stays
+    responsive while yt is loading a file or series.
+    Parameters:
+        loadFunc: function that loads and returns the dataset or series
+        args: arguments that are passed to loadFunc
+    """
+    def __init__(self, loadFunc, *args):
+        super().__init__()
+        self.loadFunc = loadFunc
+        self.args = args
+        self.signals = LoadSignals()
+
+    @QC.pyqtSlot()
+    def run(self):
+        try:
+            result = self.loadFunc(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(e)
+            return
+        self.signals.finished.emit(result)
+
+
+RunningLoaders = set()  # References to the LoadWorkers until they are done
+
+
+def startLoading(Param_Dict, loadFunc, args, onFinished, onFailed):
+    """Starts a LoadWorker in the global thread pool.
+    Parameters:
+        Param_Dict: for keeping track whether there is a file being loaded
+        loadFunc: function that loads and returns the dataset or series
+        args: tuple of arguments that are passed to loadFunc
+        onFinished: slot receiving the loaded object
+        onFailed: slot receiving the exception if loading failed
+    returns:
+        worker: the LoadWorker, or None if there is still something being
+            loaded
+    """
+    if Param_Dict["LoadingInFlight"]:
+        GUILogger.warning("Please wait until the current loading process "
+                          "has finished.")
+        return None
+    Param_Dict["LoadingInFlight"] = True
+
+    def resetFlag():
+        Param_Dict["LoadingInFlight"] = False
+    # The flag needs to be reset before the actual slots are called since
+    # they might start loading again.
+    return startWorker(loadFunc, args, onFinished, onFailed, resetFlag)
+
+
+def startWorker(func, args, onFinished, onFailed, onDone=None):
+    """Runs func(*args) in a LoadWorker in the global thread pool.
+    Parameters:
+        func: function whose result is passed to onFinished
+        args: tuple of arguments that are passed to func
+        onFinished: slot receiving the result
+        onFailed: slot receiving the exception if func raised one
+        onDone: optional function that is called before either of them
+    returns:
+        worker: the LoadWorker
+    """
+    worker = LoadWorker(func, *args)
+
+    def done():
+        RunningLoaders.discard(worker)
+        if onDone is not None:
+            onDone()
+    worker.signals.finished.connect(done)
+    worker.signals.failed.connect(done)
+    worker.signals.finished.connect(onFinished)
+    worker.signals.failed.connect(onFailed)
+    RunningLoaders.add(worker)
+    QC.QThreadPool.globalInstance().start(worker)
+    return worker
+
+
 # %% Function for evaluating single file data
 def evaluateSingle(Param_Dict, worker):
     """Handles the different cases needed for evaluation of a Data or
@@ -257,17 +343,29 @@ def evaluateMultiple(Param_Dict, Request_Dict, slider, worker):
     sut.emitStatus(worker, f"Creating the initial {mode.lower()} plot")
     # For lineplotting we need to remember the grid unit
     Param_Dict["oldGridUnit"] = Param_Dict["GridUnit"]
-    i = 0
-    for j in range(Request_Dict["Length"]):
-        if i % onlyEvery == 0:
-            # The following will set the plotWindow and dataset to the one we want
-            Param_Dict["SignalHandler"].getSliderInput(value=j, seriesEval=True)
-            # Convenient way to choose the right plot function
-            eval(f"splot.{mode}Plot(Param_Dict, worker)")
-            GUILogger.info(f"Progress: {int(i/onlyEvery+1)}/{plotnum} {mode.lower()} plots done.")
-            if Request_Dict["MakeMovie"]:
-                saveName = f"{directory}/{mode}plot_{i+1}"
-                Param_Dict["CurrentPlotWindow"].saveFigure(saveName)
-            sut.emitMultiStatus(worker, i, plotnum)
-        i += 1
+    series = Param_Dict["DataSeries"]
+    length = Request_Dict["Length"]
+    # While a dataset is plotted, the next one is already loaded in the
+    # background so reading the file and plotting overlap. peek doesn't push
+    # the datasets used by the slider out of the cache of the series.
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        nextDataSet = prefetcher.submit(series.peek, 0)
+        i = 0
+        for j in range(length):
+            if i % onlyEvery == 0:
+                ds = nextDataSet.result()
+                if j + onlyEvery < length:
+                    nextDataSet = prefetcher.submit(series.peek,
+                                                    j + onlyEvery)
+                # The following will set the plotWindow and dataset to the one we want
+                Param_Dict["SignalHandler"].getSliderInput(value=j, seriesEval=True,
+                                                           ds=ds)
+                # Convenient way to choose the right plot function
+                eval(f"splot.{mode}Plot(Param_Dict, worker)")
+                GUILogger.info(f"Progress: {int(i/onlyEvery+1)}/{plotnum} {mode.lower()} plots done.")
+                if Request_Dict["MakeMovie"]:
+                    saveName = f"{directory}/{mode}plot_{i+1}"
+                    Param_Dict["CurrentPlotWindow"].saveFigure(saveName)
+                sut.emitMultiStatus(worker, i, plotnum)
+            i += 1
     slider.setValue(j)
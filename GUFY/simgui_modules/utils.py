@@ -18,13 +18,22 @@ The module is structured as follows:
     - Helper functions for plotting, including annotations and extrema calc
     - Functions needed for threading
     - Functions for setting up a file/series
+    - Functions for caching extrema on disk
     - Functions for line drawing
 """
 
 
+import hashlib
+import json
+import os.path
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache, partial
 from math import ceil
-from os import mkdir
+from os import mkdir, stat
 import yt
 from PyQt5.Qt import PYQT_VERSION_STR as PyQtVersion
 from matplotlib import __version__ as mplVersion
@@ -35,9 +44,17 @@ from simgui_modules.logging import GUILogger
 
 
 # %% General helper functions
+@lru_cache(maxsize=None)
+def getIcon(path):
+    """Returns the QIcon for the image at path. QIcons are implicitly shared,
+    so each image only needs to be read once. This may only be called after
+    the QApplication has been created."""
+    return QG.QIcon(path)
+
+
 def alertUser(text, title="Something went wrong"):
     Alert = QW.QMessageBox()
-    Alert.setWindowIcon(QG.QIcon('simgui_registry/CoverIcon.png'))
+    Alert.setWindowIcon(getIcon('simgui_registry/CoverIcon.png'))
     Alert.setIcon(QW.QMessageBox.Warning)
     Alert.setWindowTitle(title)
     Alert.setText(text)
@@ -81,9 +98,7 @@ def findIndex(Param_Dict):
     Unfortunately there seems to be no easier way.
     Returns:
         index: int: index of the current dataset in the series"""
-    nameList = [str(ds) for ds in Param_Dict["DataSeries"]]
-    index = nameList.index(str(Param_Dict["CurrentDataSet"]))
-    return index
+    return Param_Dict["DataSeries"].index(Param_Dict["CurrentDataSet"])
 
 
 def mean(xs):
@@ -93,6 +108,27 @@ def mean(xs):
     return sum(xs)/len(xs)
 
 
+def addAppStyleSheet(app, styleSheet):
+    """Adds styleSheet to the style sheet of the QApplication app if it isn't
+    there yet. Style sheets that are shared by many widgets are set this way
+    so Qt only needs to parse them once."""
+    appStyleSheet = app.styleSheet()
+    if styleSheet not in appStyleSheet:
+        app.setStyleSheet(appStyleSheet + "\n" + styleSheet)
+
+
+@contextmanager
+def pausedUpdates(widget):
+    """Context manager that disables the painting of widget and its children
+    while a lot of them are changed at once, so they are only repainted once
+    afterwards."""
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
 def refreshWidgets(Edit_Dict, ComboBox_Dict):
     """Emits all the signals for the lineEdits and ComboBoxes so they get
     updated"""
@@ -313,6 +349,177 @@ class WorkingException(Exception):
 
 
 # %% Functions for setting up a file/series
+# Size of the HDF5 chunk cache used for the simulation files. The number of
+# slots should be a prime number about 100 times the number of chunks fitting
+# into the cache.
+H5ChunkCacheBytes = 128*1024**2
+H5ChunkCacheSlots = 100003
+
+
+def enlargeChunkCache(ds):
+    """yt opens the HDF5 files with the default chunk cache of h5py (1 MiB),
+    which is much too small for the block structure of FLASH files. Since the
+    frontend doesn't pass on any arguments to h5py, reopen the file handle of
+    ds with a larger cache.
+    The reads of the blocks themselves are done by yt's IO handler, so this
+    cache is the only buffer that is shared between the reads of a dataset.
+    This relies on the internals of the FLASH frontend, so other frontends
+    are left alone, and the original handle is kept if anything goes wrong.
+    Parameters:
+        ds: yt DataSet object
+    """
+    if not str(getattr(ds, "dataset_type", "")).startswith("flash"):
+        return  # This is a series or not a FLASH dataset
+    handler = getattr(ds, "_handle", None)
+    oldHandle = getattr(handler, "handle", None)
+    if oldHandle is None:
+        return
+    try:
+        import h5py
+        newHandle = h5py.File(oldHandle.filename, "r",
+                              rdcc_nbytes=H5ChunkCacheBytes,
+                              rdcc_nslots=H5ChunkCacheSlots)
+    except Exception as e:
+        GUILogger.debug(f"Couldn't enlarge the chunk cache: {e}")
+        return
+    # Only close the original file once the new one is in place
+    handler.handle = newHandle
+    oldHandle.close()
+
+
+def loadDataSet(path):
+    """Loads the dataset at path using yt and enlarges its chunk cache."""
+    ds = yt.load(path)
+    enlargeChunkCache(ds)
+    return ds
+
+
+@lru_cache(maxsize=None)
+def getDataSetTime(path, mtime):
+    """Returns the current time of the dataset at path in kyr. The dataset is
+    only opened to read the time and isn't kept. The result is cached, and
+    mtime (that of the file) makes sure it is read again once the file has
+    changed."""
+    return yt.load(path).current_time.in_units("kyr")
+
+
+class LazyDataSeries(object):
+    """A series of datasets that are only loaded once they are accessed.
+    The most recently used datasets are kept loaded, so the memory needed
+    does not grow with the length of the series.
+    Loops over the whole series should use the paths or names, or peek at
+    the datasets, so they don't push the datasets in use out of the cache.
+    Parameters:
+        paths: list of the file names of the datasets
+        cacheSize: number of datasets to keep loaded
+    """
+    def __init__(self, paths, cacheSize=8):
+        self.paths = list(paths)
+        # The names are the same as str(ds) of the datasets
+        self.names = [os.path.basename(path) for path in self.paths]
+        self.cacheSize = cacheSize
+        self.times = None  # Filled by readTimes
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()  # Datasets may be loaded in threads
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __getitem__(self, index):
+        path = self.paths[index]
+        with self._lock:
+            ds = self._cache.pop(path, None)
+        if ds is None:
+            ds = loadDataSet(path)
+        with self._lock:
+            self._cache[path] = ds
+            while len(self._cache) > self.cacheSize:
+                self._cache.popitem(last=False)
+        return ds
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def peek(self, index):
+        """Returns the dataset at index without keeping it loaded if it
+        isn't already."""
+        with self._lock:
+            ds = self._cache.get(self.paths[index])
+        if ds is None:
+            ds = loadDataSet(self.paths[index])
+        return ds
+
+    def iterPeek(self):
+        """Iterates over the datasets of the series using peek"""
+        for i in range(len(self)):
+            yield self.peek(i)
+
+    def getTime(self, index):
+        """Returns the current time of the dataset at index in kyr. The
+        dataset is only opened if its time hasn't been read by readTimes and
+        it isn't loaded already."""
+        if self.times is not None:
+            return self.times[index]
+        path = self.paths[index]
+        with self._lock:
+            ds = self._cache.get(path)
+        if ds is not None:
+            return ds.current_time.in_units("kyr")
+        return getDataSetTime(path, os.path.getmtime(path))
+
+    def readTimes(self):
+        """Reads the times of all datasets of the series, which means opening
+        each of the files. This is meant to be done in the LoadWorker, and
+        the files are opened concurrently since the time is mostly spent
+        waiting for the disk. Each thread loads its own files, so no dataset
+        is used by more than one thread. The first dataset is kept loaded
+        as it is shown first."""
+        length = len(self)
+        if length == 0:
+            return
+        times = [self[0].current_time.in_units("kyr")]
+        restPaths = self.paths[1:]
+        mtimes = [os.path.getmtime(path) for path in restPaths]
+        workers = max(1, min(16, len(restPaths)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            timeIter = pool.map(getDataSetTime, restPaths, mtimes)
+            for i, time in enumerate(timeIter, start=1):
+                times.append(time)
+                if i % ceil(length/4) == 0:  # This way, at max 4 updates are printed
+                    GUILogger.info(f"Read the time of dataset {i+1}/{length}...")
+        self.times = times
+
+    def isLoaded(self, index):
+        """Returns whether the dataset at index is currently kept loaded"""
+        with self._lock:
+            return self.paths[index] in self._cache
+
+    def index(self, ds):
+        """Returns the index of the dataset ds in the series without loading
+        the other datasets."""
+        return self.names.index(str(ds))
+
+
+@lru_cache(maxsize=8)
+def findSeriesFiles(path, mtime):
+    """Returns the file names yt finds for the series given by path. The
+    result is cached, and mtime (that of the directory) makes sure it is
+    looked up again once files have been added or removed."""
+    return tuple(yt.load(path)._pre_outputs)
+
+
+def makeLazySeries(ts):
+    """Wraps the yt DataSetSeries ts in a LazyDataSeries and reads the times
+    of its datasets. Anything else (e.g. a single dataset) is returned as it
+    is."""
+    if hasattr(ts, "_pre_outputs"):
+        series = LazyDataSeries(ts._pre_outputs)
+        series.readTimes()
+        return series
+    return ts
+
+
 def calculateKnownExtrema(Param_Dict, Edit_Dict):
     """Our Dataset already has some of the extrema as attributes, so we can add
     those to the Mins and Maxs.
@@ -419,12 +626,12 @@ def updateComboBoxes(Param_Dict, ComboBox_Dict):
             weightBox.setCurrentText(lastWeight)  # if not possible, just return to None
     # Set default values for y axis to second entry
     ComboBox_Dict["YAxis"].setCurrentText("temp")
-    ComboBox_Dict["XAxis"].currentIndexChanged.connect(lambda: Param_Dict["SignalHandler"].getAxisInput("X"))
-    ComboBox_Dict["YAxis"].currentIndexChanged.connect(lambda: Param_Dict["SignalHandler"].getAxisInput("Y"))
-    ComboBox_Dict["ZAxis"].currentIndexChanged.connect(lambda: Param_Dict["SignalHandler"].getAxisInput("Z"))
-    ComboBox_Dict["NAxis"].currentIndexChanged.connect(lambda: Param_Dict["SignalHandler"].getAxisInput("N"))
-    ComboBox_Dict["YWeight"].currentIndexChanged.connect(lambda: Param_Dict["SignalHandler"].getWeightField("Y"))
-    ComboBox_Dict["ZWeight"].currentIndexChanged.connect(lambda: Param_Dict["SignalHandler"].getWeightField("Z"))
+    ComboBox_Dict["XAxis"].currentIndexChanged.connect(partial(Param_Dict["SignalHandler"].getAxisInput, "X"))
+    ComboBox_Dict["YAxis"].currentIndexChanged.connect(partial(Param_Dict["SignalHandler"].getAxisInput, "Y"))
+    ComboBox_Dict["ZAxis"].currentIndexChanged.connect(partial(Param_Dict["SignalHandler"].getAxisInput, "Z"))
+    ComboBox_Dict["NAxis"].currentIndexChanged.connect(partial(Param_Dict["SignalHandler"].getAxisInput, "N"))
+    ComboBox_Dict["YWeight"].currentIndexChanged.connect(partial(Param_Dict["SignalHandler"].getWeightField, "Y"))
+    ComboBox_Dict["ZWeight"].currentIndexChanged.connect(partial(Param_Dict["SignalHandler"].getWeightField, "Z"))
     Param_Dict["SignalHandler"].getWeightField("Y")
     Param_Dict["SignalHandler"].getWeightField("Z")
 
@@ -523,10 +730,134 @@ def updateNormalAxis(Param_Dict, ComboBox_Dict):
     normBox.clear()
     normBox.addItems(Param_Dict["NFields"])
     normBox.setCurrentText(Param_Dict["NAxis"])
-    normBox.currentIndexChanged.connect(lambda: Param_Dict["SignalHandler"].getAxisInput("N"))
+    normBox.currentIndexChanged.connect(partial(Param_Dict["SignalHandler"].getAxisInput, "N"))
     Param_Dict["SignalHandler"].getAxisInput("N")
 
 
+# %% Functions for caching extrema on disk
+# Anchored on the GUFY directory so it doesn't depend on the working directory
+ExtremaCachePath = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "simgui_registry", "extremaCache.json")
+ExtremaCacheSize = 64  # Number of files the extrema are remembered for
+ExtremaCache = None  # Only loaded once it is needed
+
+
+def readExtremaCache():
+    """Reads the extrema cache file written by saveExtremaCache. It is a
+    JSON list of [filename, mtime, fieldHash, entry] items, which is checked
+    while it is converted back.
+    returns:
+        cache: OrderedDict mapping the file signatures to the extrema
+    """
+    with open(ExtremaCachePath) as cacheFile:
+        items = json.load(cacheFile)
+    cache = OrderedDict()
+    for filename, mtime, fieldHash, entry in items:
+        if not (isinstance(filename, str) and isinstance(mtime, int)
+                and isinstance(fieldHash, str) and isinstance(entry, dict)):
+            raise ValueError("not a valid extrema cache")
+        cache[(filename, mtime, fieldHash)] = {
+            str(field): (float(fieldMin), float(fieldMax), str(unit))
+            for field, (fieldMin, fieldMax, unit) in entry.items()}
+    return cache
+
+
+def getExtremaCache():
+    """Loads the extrema cache from disk the first time it is needed. If the
+    file is missing or can't be read, an empty cache is used.
+    returns:
+        ExtremaCache: OrderedDict mapping the file signatures to the extrema
+    """
+    global ExtremaCache
+    if ExtremaCache is None:
+        try:
+            ExtremaCache = readExtremaCache()
+        except Exception:  # e.g. a file of another format or version
+            ExtremaCache = OrderedDict()
+    return ExtremaCache
+
+
+def getExtremaSignature(Param_Dict):
+    """Returns a signature of the current file consisting of its name,
+    modification time and a hash of the derived fields that have been added,
+    since a field may be redefined under the same name. Returns None if we
+    are not dealing with a single file."""
+    filename = Param_Dict["Filename"]
+    if Param_Dict["EvalMode"] != "Single" or not filename:
+        return None
+    try:
+        mtime = stat(filename).st_mtime_ns
+    except OSError:
+        return None
+    fieldSet = sorted((name, field["FunctionText"], str(field["Unit"]),
+                       field["Override"])
+                      for name, field in Param_Dict["NewDerFieldDict"].items())
+    fieldHash = hashlib.blake2b(repr(fieldSet).encode()).hexdigest()
+    return (filename, mtime, fieldHash)
+
+
+def cacheExtrema(Param_Dict):
+    """Stores the extrema calculated for the current file in the cache."""
+    signature = getExtremaSignature(Param_Dict)
+    if signature is None:
+        return
+    cache = getExtremaCache()
+    entry = cache.pop(signature, {})
+    for field, fieldMin in Param_Dict["FieldMins"].items():
+        try:
+            unit = str(Param_Dict["FieldUnits"][field])
+            entry[field] = (float(fieldMin),
+                            float(Param_Dict["FieldMaxs"][field]), unit)
+        except (KeyError, TypeError, ValueError):
+            continue
+    cache[signature] = entry
+    while len(cache) > ExtremaCacheSize:
+        cache.popitem(last=False)
+    saveExtremaCache()
+
+
+def restoreCachedExtrema(Param_Dict):
+    """Fills FieldMins and FieldMaxs with the extrema that have been
+    calculated for the current file before. Extrema that are already known
+    or have been stored in a different unit are left untouched, as well as
+    the ones with units the current dataset doesn't know."""
+    signature = getExtremaSignature(Param_Dict)
+    if signature is None:
+        return
+    cache = getExtremaCache()
+    entry = cache.get(signature)
+    if entry is None:
+        return
+    cache.move_to_end(signature)
+    for field, (fieldMin, fieldMax, unit) in entry.items():
+        if field in Param_Dict["FieldMins"]:
+            continue
+        if field not in Param_Dict["FieldUnits"]:
+            try:  # Code units are only known to the dataset
+                units = Param_Dict["CurrentDataSet"].quan(1, unit).units
+            except Exception:
+                continue
+            Param_Dict["FieldUnits"][field] = units
+        elif str(Param_Dict["FieldUnits"][field]) != unit:
+            continue
+        Param_Dict["FieldMins"][field] = fieldMin
+        Param_Dict["FieldMaxs"][field] = fieldMax
+    GUILogger.debug(f"Restored the extrema of {len(entry)} fields from cache.")
+
+
+def saveExtremaCache():
+    """Writes the extrema cache to disk."""
+    if ExtremaCache is None:
+        return
+    items = [[*signature, entry] for signature, entry in ExtremaCache.items()]
+    try:
+        with open(ExtremaCachePath, "w") as cacheFile:
+            json.dump(items, cacheFile)
+    except OSError:
+        pass
+
+
 # %% Functions for line drawing:
 def getCoordInput(Param_Dict, event, key):
     """When the user clicks on the canvas, read out the coordinates and store
@@ -539,7 +870,7 @@ def getCoordInput(Param_Dict, event, key):
     # We only want data out of the main axis
     heightAxis = Param_Dict["CurrentPlotWindow"].Param_Dict["NAxis"].upper()
     height = Param_Dict["CurrentPlotWindow"].Param_Dict[heightAxis + "Center"]
-    if str(event.inaxes)[:11] == "AxesSubplot":
+    if event.inaxes is Param_Dict["CurrentPlotWindow"].ax:
         if key == "start":
             Param_Dict["XLStart"] = event.xdata
             Param_Dict["YLStart"] = event.ydata
@@ -554,29 +885,15 @@ def shuffleCoords(Param_Dict):
     """The coordinates may need to be shuffled if the user doesn't have the
     z-axis as normal vector.
     """
-    starts = ["XLStart", "YLStart", "ZLStart"]
-    ends = ["XLEnd", "YLEnd", "ZLEnd"]
-    # save the values for shuffling
-    svalues = [Param_Dict[key] for key in starts]
-    evalues = [Param_Dict[key] for key in ends]
-    if Param_Dict["NAxis"] == "x":
-        # This shuffles the list in a cyclic way: [1, 2, 3] -> [2, 3, 1]
-        svalues.append(svalues.pop(0))
-        evalues.append(evalues.pop(0))
-        # and once more
-        svalues.append(svalues.pop(0))
-        evalues.append(evalues.pop(0))
-    elif Param_Dict["NAxis"] == "y":
-        svalues.append(svalues.pop(0))
-        evalues.append(evalues.pop(0))
-    elif Param_Dict["NAxis"] == "z":
-        # no shuffling needed
-        pass
-    else:
+    # Number of cyclic shifts needed: [1, 2, 3] -> [2, 3, 1] is one shift
+    shift = {"x": 2, "y": 1, "z": 0}.get(Param_Dict["NAxis"])
+    if shift is None:
         GUILogger.error("Something went wrong when transferring the coordinates to LinePlot")
-    for i in range(3):
-        Param_Dict[starts[i]] = svalues[i]
-        Param_Dict[ends[i]] = evalues[i]
+        return
+    for keys in (("XLStart", "YLStart", "ZLStart"), ("XLEnd", "YLEnd", "ZLEnd")):
+        values = [Param_Dict[key] for key in keys]
+        values = values[shift:] + values[:shift]
+        Param_Dict.update(zip(keys, values))
 
 
 def changeToLinePlot(Param_Dict, Edit_Dict):